@@ -132,14 +132,27 @@ def create_app():
     from routes.api import api_bp    # noqa: PLC0415
     from routes.web import web_bp    # noqa: PLC0415
     from routes.auth import auth_bp  # noqa: PLC0415
+    from routes.jobs import jobs_bp  # noqa: PLC0415
 
     app.register_blueprint(api_bp)
     app.register_blueprint(web_bp)
     app.register_blueprint(auth_bp)
+    app.register_blueprint(jobs_bp)
 
     # Tighter rate limit on auth routes to deter brute-force
     limiter.limit('10 per minute')(auth_bp)
 
+    # ------------------------------------------------------------------
+    # Pipeline processor — one instance per process, built here so that
+    # gunicorn's preload shares it copy-on-write; requests and in-process
+    # tasks use current_app.extensions['clinical_processor']
+    # ------------------------------------------------------------------
+    if os.getenv('ANTHROPIC_API_KEY'):
+        from tasks import get_processor  # noqa: PLC0415
+        app.extensions['clinical_processor'] = get_processor()
+    else:
+        logger.warning('ANTHROPIC_API_KEY is not set — pipeline processor not initialised.')
+
     # ------------------------------------------------------------------
     # Error handlers
     # ------------------------------------------------------------------
@@ -183,7 +196,11 @@ def register_error_handlers(app):
 
 
 if __name__ == '__main__':
-    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO'))
+    from modules.logging_config import configure_logging  # noqa: PLC0415
+    configure_logging()
+
+    # Werkzeug dev server for local use; production runs under gunicorn:
+    #     gunicorn -c gunicorn.conf.py wsgi:application
     application = create_app()
 
     host = os.getenv('FLASK_HOST', '127.0.0.1')
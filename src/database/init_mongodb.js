@@ -37,7 +37,8 @@ db.createCollection('fhir_bundles', {
 db.fhir_bundles.createIndex({ transaction_id: 1 }, { unique: true });
 db.fhir_bundles.createIndex({ created_at: 1 });
 db.fhir_bundles.createIndex({ 'bundle.type': 1 });
-db.fhir_bundles.createIndex({ confidence_score: 1 });
+// Review queue: confidence_score < threshold, newest first
+db.fhir_bundles.createIndex({ confidence_score: 1, created_at: -1 });
 
 // Create Clinical Notes collection (for future reference to original notes)
 db.createCollection('clinical_notes', {
@@ -88,9 +89,11 @@ db.createCollection('clinician_reviews', {
     }
 });
 
-db.clinician_reviews.createIndex({ transaction_id: 1 });
+// Review history per note, newest first
+db.clinician_reviews.createIndex({ transaction_id: 1, reviewed_at: -1 });
 db.clinician_reviews.createIndex({ reviewed_at: 1 });
 db.clinician_reviews.createIndex({ clinician_id: 1 });
+db.clinician_reviews.createIndex({ action: 1, reviewed_at: -1 });
 
 // Grant appropriate permissions to clinicaluser
 db.createUser({
@@ -0,0 +1,26 @@
+"""
+Gunicorn Configuration
+The app is built once in the master (preload_app) and shared copy-on-write
+with the forked workers; database clients are re-opened per worker since
+sockets must not be shared across processes
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('FLASK_HOST', '127.0.0.1')}:{os.getenv('FLASK_PORT', '5000')}"
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+preload_app = True
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+accesslog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+
+def post_fork(server, worker):
+    """Give each worker its own log listener and database connections"""
+    from modules.logging_config import restart_logging_after_fork  # noqa: PLC0415
+    from modules.database import reconnect_after_fork  # noqa: PLC0415
+    restart_logging_after_fork()
+    reconnect_after_fork()
@@ -4,17 +4,31 @@ End-to-end clinical note processing pipeline
 Supports both file-based and database-backed storage
 """
 
-import json
+import asyncio
+import atexit
+import copy
+import hashlib
+import logging
+import os
 import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import ijson
+import orjson
 
 # Import modules
 from modules.deidentification import create_deidentifier
 from modules.audit_logger import create_audit_logger
 from modules.claude_api import create_claude_api_wrapper
 from modules.fhir_transformer import create_fhir_transformer
+from modules.logging_config import configure_logging, shutdown_logging
 
 # Try to import database module; fall back gracefully if not available
 try:
@@ -23,23 +37,43 @@ try:
 except (ImportError, Exception):
     DB_AVAILABLE = False
 
+logger = logging.getLogger('clinical')
+
 
 class ClinicalNoteProcessor:
     """
     Main orchestrator for the HIPAA-compliant clinical note automation pipeline
     """
 
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", mongo_flush_every: Optional[int] = None):
         """
         Initialize the clinical note processor
 
         Args:
             log_dir: Directory for audit logs
+            mongo_flush_every: Buffer this many transactions before writing them
+                to MongoDB in one bulk write (defaults to MONGO_FLUSH_EVERY, or 1)
         """
         self.deidentifier = create_deidentifier()
         self.audit_logger = create_audit_logger(log_dir)
         self.claude_api = create_claude_api_wrapper(audit_logger=self.audit_logger)
         self.fhir_transformer = create_fhir_transformer(audit_logger=self.audit_logger)
+        # Shared, pooled MongoDB connection (fetched once, not per save)
+        self.mongodb = get_mongodb_connection() if DB_AVAILABLE else None
+
+        # Pending (fhir_bundle, clinical_note) document fields awaiting a bulk write
+        self.mongo_flush_every = max(1, mongo_flush_every or int(os.getenv('MONGO_FLUSH_EVERY', '1')))
+        self._pending_writes: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        self._pending_lock = threading.Lock()
+        if self.mongodb and self.mongo_flush_every > 1:
+            atexit.register(self.flush_pending_writes)
+
+        # Stages 1-2 of recently processed conversations, keyed by a digest
+        # under a per-process random key so it is never a stable PHI identifier
+        self._stage_cache: 'OrderedDict[bytes, Dict[str, Any]]' = OrderedDict()
+        self._stage_cache_size = int(os.getenv('STAGE_CACHE_SIZE', 256))
+        self._stage_cache_key = os.urandom(32)
+        self._stage_cache_lock = threading.Lock()
 
     def process_conversation(
         self,
@@ -59,159 +93,461 @@ class ClinicalNoteProcessor:
         # Generate transaction ID if not provided
         transaction_id = transaction_id or str(uuid.uuid4())
 
-        print(f"\n{'='*80}")
-        print(f"Processing Transaction: {transaction_id}")
-        print(f"{'='*80}\n")
+        # FHIR resources are built as Claude streams each field (STAGE 3 overlaps STAGE 2)
+        bundle_builder = self.fhir_transformer.create_bundle_builder(transaction_id)
 
-        result = {
-            'transaction_id': transaction_id,
-            'stages': {},
-            'success': False
-        }
+        result, masked_text, structured_output = self._run_claude_stages(
+            raw_conversation, transaction_id, on_field=bundle_builder.add_field
+        )
+        if structured_output is None:
+            return result
 
         try:
-            # STAGE 1: De-identification
-            print("STAGE 1: De-identification")
-            print("-" * 40)
-            masked_text, deidentification_audit = self.deidentifier.deidentify(raw_conversation)
+            # STAGE 3: FHIR Transformation
+            logger.info('stage_start', extra={'stage': 3, 'transaction_id': transaction_id})
 
-            # Validate de-identification
-            validation_report = self.deidentifier.validate_deidentification(masked_text)
+            fhir_bundle, resource_counts = bundle_builder.finalize(structured_output)
+            return self._complete_pipeline(
+                result, masked_text, structured_output, fhir_bundle, resource_counts
+            )
 
-            self.audit_logger.log_deidentification(
-                transaction_id=transaction_id,
-                original_length=deidentification_audit['original_length'],
-                masked_length=deidentification_audit['masked_length'],
-                redaction_counts=deidentification_audit.get('redactions_by_type', {}),
-                validation_report=validation_report
+        except Exception as e:
+            return self._record_failure(result, e)
+
+    async def process_conversation_async(
+        self,
+        raw_conversation: str,
+        transaction_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of process_conversation for callers running an event loop
+
+        The Claude call is awaited on the loop (AsyncAnthropic); CPU-bound
+        de-identification, FHIR assembly and blocking audit writes run in
+        worker threads so many conversations can be in flight at once.
+
+        Args:
+            raw_conversation: The unstructured clinical conversation text
+            transaction_id: Optional transaction ID (generates if not provided)
+
+        Returns:
+            Dictionary with processing results
+        """
+        transaction_id = transaction_id or str(uuid.uuid4())
+        result = self._start_result(transaction_id)
+        bundle_builder = self.fhir_transformer.create_bundle_builder(transaction_id)
+
+        try:
+            cached = await asyncio.to_thread(self._load_cached_stages, result, raw_conversation)
+            if cached is not None:
+                masked_text, structured_output = cached
+            else:
+                masked_text, deidentification_audit, validation_report = await asyncio.to_thread(
+                    self._run_deidentification, result, raw_conversation, transaction_id
+                )
+
+                # STAGE 2: Claude API Processing
+                logger.info('stage_start', extra={'stage': 2, 'transaction_id': transaction_id})
+
+                structured_output, _ = await self.claude_api.process_clinical_conversation_async(
+                    masked_conversation=masked_text,
+                    transaction_id=transaction_id,
+                    on_field=bundle_builder.add_field,
+                    parsed_only=True
+                )
+                await asyncio.to_thread(
+                    self._record_claude_output, result, transaction_id, structured_output
+                )
+                self._remember_stages(
+                    raw_conversation, transaction_id, masked_text,
+                    deidentification_audit, validation_report, structured_output
+                )
+
+            # STAGE 3: FHIR Transformation
+            logger.info('stage_start', extra={'stage': 3, 'transaction_id': transaction_id})
+
+            fhir_bundle, resource_counts = await asyncio.to_thread(
+                bundle_builder.finalize, structured_output
+            )
+            return await asyncio.to_thread(
+                self._complete_pipeline,
+                result, masked_text, structured_output, fhir_bundle, resource_counts
             )
 
-            result['stages']['deidentification'] = {
-                'status': 'success',
-                'redactions': deidentification_audit.get('redactions_by_type', {}),
-                'validation_safe': validation_report['is_safe'],
-                'phi_risks_found': len(validation_report.get('remaining_phi_risks', []))
-            }
+        except Exception as e:
+            return self._record_failure(result, e)
 
-            print(f"✓ Redactions applied: {deidentification_audit.get('total_redactions', 0)}")
-            print(f"✓ Validation safe: {validation_report['is_safe']}")
-            if not validation_report['is_safe']:
-                print(f"  WARNING: Remaining PHI risks: {validation_report['remaining_phi_risks']}")
-            print(f"✓ Original length: {deidentification_audit['original_length']} chars")
-            print(f"✓ Masked length: {deidentification_audit['masked_length']} chars\n")
+    async def process_batch_conversations_async(
+        self,
+        conversation_list: list,
+        max_concurrency: Optional[int] = None
+    ) -> list:
+        """
+        Async counterpart of process_batch_conversations
+
+        Runs process_conversation_async for every conversation on one event
+        loop, with at most max_concurrency (defaults to the BATCH_WORKERS env
+        var, or 8) pipelines in flight at once.
+
+        Returns:
+            List of processing results, in the same order as the input
+        """
+        max_concurrency = max_concurrency or int(os.getenv('BATCH_WORKERS', 8))
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _one(conversation: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process_conversation_async(conversation)
+
+        return await asyncio.gather(*(_one(c) for c in conversation_list))
+
+    def process_batch_conversations(
+        self,
+        conversation_list: list,
+        max_workers: Optional[int] = None
+    ) -> list:
+        """
+        Process multiple conversations in batch
+
+        Each conversation runs end-to-end on a thread pool: the pipeline is
+        dominated by Claude API latency, and FHIR resources are built while
+        each response streams in.
+
+        Args:
+            conversation_list: List of conversation texts
+            max_workers: Maximum concurrent Claude calls (defaults to the
+                BATCH_WORKERS env var, or 8). Keep this below the Anthropic
+                rate limit for the configured model.
+
+        Returns:
+            List of processing results, in the same order as the input
+        """
+        if not conversation_list:
+            return []
+
+        max_workers = max_workers or int(os.getenv('BATCH_WORKERS', 8))
+        max_workers = max(1, min(max_workers, len(conversation_list)))
+
+        logger.info('batch_start', extra={'conversations': len(conversation_list), 'workers': max_workers})
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.process_conversation, conversation_list))
+
+        logger.info('batch_complete', extra={'seconds': round(time.perf_counter() - start, 3)})
+
+        return results
+
+    def _run_claude_stages(
+        self,
+        raw_conversation: str,
+        transaction_id: str,
+        on_field: Optional[Callable[[str, Any], None]] = None
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Run de-identification and Claude extraction (stages 1-2)
+
+        Args:
+            raw_conversation: The unstructured clinical conversation text
+            transaction_id: Transaction ID for audit correlation
+            on_field: Optional callback that receives each top-level field of
+                Claude's output as it streams in
+
+        Returns:
+            Tuple of (result, masked_text, structured_output); the last two
+            are None if a stage failed, in which case result holds the error
+        """
+        result = self._start_result(transaction_id)
+
+        try:
+            cached = self._load_cached_stages(result, raw_conversation)
+            if cached is not None:
+                return (result, *cached)
+
+            masked_text, deidentification_audit, validation_report = self._run_deidentification(
+                result, raw_conversation, transaction_id
+            )
 
             # STAGE 2: Claude API Processing
-            print("STAGE 2: Claude API Processing")
-            print("-" * 40)
+            logger.info('stage_start', extra={'stage': 2, 'transaction_id': transaction_id})
 
-            structured_output, raw_response = self.claude_api.process_clinical_conversation(
+            structured_output, _ = self.claude_api.process_clinical_conversation(
                 masked_conversation=masked_text,
-                transaction_id=transaction_id
+                transaction_id=transaction_id,
+                on_field=on_field,
+                parsed_only=True
+            )
+            self._record_claude_output(result, transaction_id, structured_output)
+            self._remember_stages(
+                raw_conversation, transaction_id, masked_text,
+                deidentification_audit, validation_report, structured_output
             )
 
-            # Validate output schema
-            is_valid, schema_errors = self.claude_api.validate_output_schema(structured_output)
+            return result, masked_text, structured_output
 
-            if not is_valid:
-                raise ValueError(f"Claude output schema validation failed: {schema_errors}")
+        except Exception as e:
+            return self._record_failure(result, e), None, None
 
-            result['stages']['claude_processing'] = {
-                'status': 'success',
-                'confidence_score': structured_output.get('ai_confidence_score', 0),
-                'flagged_for_review': structured_output.get('flagged_for_review', False),
-                'review_notes': structured_output.get('review_notes', '')
-            }
+    @staticmethod
+    def _start_result(transaction_id: str) -> Dict[str, Any]:
+        """Create the result record for a new transaction"""
+        logger.info('transaction_start', extra={'transaction_id': transaction_id})
 
-            print(f"✓ Claude processed successfully")
-            print(f"✓ Confidence score: {structured_output.get('ai_confidence_score', 0)}/100")
-            print(f"✓ Flagged for review: {structured_output.get('flagged_for_review', False)}")
-            if structured_output.get('flagged_for_review'):
-                print(f"  Review notes: {structured_output.get('review_notes', 'N/A')}\n")
-            else:
-                print()
+        return {
+            'transaction_id': transaction_id,
+            'stages': {},
+            'success': False
+        }
 
-            # Log confidence scoring
-            field_confidences = self._extract_field_confidences(structured_output)
-            low_confidence_fields = [f for f, c in field_confidences.items() if c < 70]
+    def _content_key(self, raw_conversation: str) -> bytes:
+        """Keyed digest of the raw conversation for the in-process stage cache"""
+        return hashlib.blake2b(
+            raw_conversation.encode('utf-8'), key=self._stage_cache_key, digest_size=32
+        ).digest()
 
-            self.audit_logger.log_confidence_scoring(
-                transaction_id=transaction_id,
-                overall_confidence=structured_output.get('ai_confidence_score', 0),
-                field_confidences=field_confidences,
-                low_confidence_fields=low_confidence_fields
-            )
+    def _load_cached_stages(
+        self,
+        result: Dict[str, Any],
+        raw_conversation: str
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Reuse stages 1-2 from an earlier transaction with identical raw content
 
-            # STAGE 3: FHIR Transformation
-            print("STAGE 3: FHIR Transformation")
-            print("-" * 40)
+        On a hit the Claude call is skipped, but the de-identification audit
+        events are still written for the new transaction; the FHIR bundle is
+        built fresh.
 
-            fhir_bundle, resource_counts = self.fhir_transformer.transform_to_fhir_bundle(
-                claude_output=structured_output,
-                transaction_id=transaction_id
-            )
+        Returns:
+            Tuple of (masked_text, structured_output) on a cache hit, else None
+        """
+        if self._stage_cache_size <= 0:
+            return None
 
-            # Validate FHIR bundle
-            is_valid, validation_errors = self.fhir_transformer.validate_fhir_bundle(fhir_bundle)
+        content_key = self._content_key(raw_conversation)
+        with self._stage_cache_lock:
+            cached = self._stage_cache.get(content_key)
+            if cached is None:
+                return None
+            self._stage_cache.move_to_end(content_key)
 
-            if not is_valid:
-                print(f"⚠ FHIR validation warnings: {validation_errors}")
+        transaction_id = result['transaction_id']
+        source_transaction_id = cached['transaction_id']
+        self.audit_logger.log_transaction(
+            transaction_id=transaction_id,
+            stage='content_cache',
+            status='hit',
+            metadata={'source_transaction_id': source_transaction_id}
+        )
+        logger.info('content_cache_hit', extra={
+            'transaction_id': transaction_id,
+            'source_transaction_id': source_transaction_id
+        })
 
-            result['stages']['fhir_transformation'] = {
-                'status': 'success',
-                'resource_counts': resource_counts,
-                'bundle_id': fhir_bundle.get('id'),
-                'validation_passed': is_valid
-            }
+        self._record_deidentification(
+            result, transaction_id, cached['deidentification_audit'], cached['validation_report']
+        )
+        result['stages']['deidentification']['source_transaction_id'] = source_transaction_id
 
-            print(f"✓ FHIR Bundle created")
-            print(f"✓ Resources created:")
-            for resource_type, count in resource_counts.items():
-                if count > 0:
-                    print(f"  - {resource_type}: {count}")
-            print(f"✓ Bundle ID: {fhir_bundle.get('id')}\n")
-
-            # STAGE 4: Generate final output
-            print("STAGE 4: Output Generation")
-            print("-" * 40)
-
-            result['success'] = True
-            result['outputs'] = {
-                'masked_conversation': masked_text,
-                'structured_clinical_data': structured_output,
-                'fhir_bundle': fhir_bundle
-            }
+        structured_output = copy.deepcopy(cached['structured_output'])
+        self._record_claude_output(result, transaction_id, structured_output)
+        result['stages']['claude_processing']['status'] = 'cached'
 
-            print(f"✓ All stages completed successfully")
-            print(f"✓ Transaction ID: {transaction_id}\n")
+        return cached['masked_text'], structured_output
 
-            return result
+    def _remember_stages(
+        self,
+        raw_conversation: str,
+        transaction_id: str,
+        masked_text: str,
+        deidentification_audit: Dict[str, Any],
+        validation_report: Dict[str, Any],
+        structured_output: Dict[str, Any]
+    ):
+        """Add a completed stage 1-2 result to the LRU, evicting the least recently used"""
+        if self._stage_cache_size <= 0:
+            return
+        entry = {
+            'transaction_id': transaction_id,
+            'masked_text': masked_text,
+            'deidentification_audit': deidentification_audit,
+            'validation_report': validation_report,
+            'structured_output': copy.deepcopy(structured_output)
+        }
+        content_key = self._content_key(raw_conversation)
+        with self._stage_cache_lock:
+            self._stage_cache[content_key] = entry
+            self._stage_cache.move_to_end(content_key)
+            while len(self._stage_cache) > self._stage_cache_size:
+                self._stage_cache.popitem(last=False)
+
+    def _run_deidentification(
+        self,
+        result: Dict[str, Any],
+        raw_conversation: str,
+        transaction_id: str
+    ) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+        """
+        Run STAGE 1 (de-identification)
 
-        except Exception as e:
-            error_msg = f"Processing failed: {str(e)}"
-            print(f"✗ Error: {error_msg}\n")
+        Returns:
+            Tuple of (masked_text, deidentification_audit, validation_report)
+        """
+        # STAGE 1: De-identification
+        logger.info('stage_start', extra={'stage': 1, 'transaction_id': transaction_id})
+        masked_text, deidentification_audit = self.deidentifier.deidentify(raw_conversation)
 
-            result['success'] = False
-            result['error'] = error_msg
+        # Validate de-identification
+        validation_report = self.deidentifier.validate_deidentification(masked_text)
 
-            return result
+        self._record_deidentification(result, transaction_id, deidentification_audit, validation_report)
 
-    def process_batch_conversations(self, conversation_list: list) -> list:
+        return masked_text, deidentification_audit, validation_report
+
+    def _record_deidentification(
+        self,
+        result: Dict[str, Any],
+        transaction_id: str,
+        deidentification_audit: Dict[str, Any],
+        validation_report: Dict[str, Any]
+    ):
+        """Write the STAGE 1 audit event and record its result"""
+        self.audit_logger.log_deidentification(
+            transaction_id=transaction_id,
+            original_length=deidentification_audit['original_length'],
+            masked_length=deidentification_audit['masked_length'],
+            redaction_counts=deidentification_audit.get('redactions_by_type', {}),
+            validation_report=validation_report
+        )
+
+        result['stages']['deidentification'] = {
+            'status': 'success',
+            'redactions': deidentification_audit.get('redactions_by_type', {}),
+            'validation_safe': validation_report['is_safe'],
+            'phi_risks_found': len(validation_report.get('remaining_phi_risks', []))
+        }
+
+        logger.info('deidentification_complete', extra={
+            'transaction_id': transaction_id,
+            'total_redactions': deidentification_audit.get('total_redactions', 0),
+            'validation_safe': validation_report['is_safe'],
+            'original_length': deidentification_audit['original_length'],
+            'masked_length': deidentification_audit['masked_length']
+        })
+        if not validation_report['is_safe']:
+            logger.warning('remaining_phi_risks', extra={
+                'transaction_id': transaction_id,
+                'risk_types': [risk['type'] for risk in validation_report['remaining_phi_risks']]
+            })
+
+    def _record_claude_output(
+        self,
+        result: Dict[str, Any],
+        transaction_id: str,
+        structured_output: Dict[str, Any]
+    ):
+        """Validate Claude's output and record the STAGE 2 result and confidence audit"""
+        # Validate output schema
+        is_valid, schema_errors = self.claude_api.validate_output_schema(structured_output)
+
+        if not is_valid:
+            raise ValueError(f"Claude output schema validation failed: {schema_errors}")
+
+        result['stages']['claude_processing'] = {
+            'status': 'success',
+            'confidence_score': structured_output.get('ai_confidence_score', 0),
+            'flagged_for_review': structured_output.get('flagged_for_review', False),
+            'review_notes': structured_output.get('review_notes', '')
+        }
+
+        logger.info('claude_processing_complete', extra={
+            'transaction_id': transaction_id,
+            'confidence_score': structured_output.get('ai_confidence_score', 0),
+            'flagged_for_review': structured_output.get('flagged_for_review', False)
+        })
+
+        # Log confidence scoring
+        field_confidences = self._extract_field_confidences(structured_output)
+        low_confidence_fields = [f for f, c in field_confidences.items() if c < 70]
+
+        self.audit_logger.log_confidence_scoring(
+            transaction_id=transaction_id,
+            overall_confidence=structured_output.get('ai_confidence_score', 0),
+            field_confidences=field_confidences,
+            low_confidence_fields=low_confidence_fields
+        )
+
+    def _complete_pipeline(
+        self,
+        result: Dict[str, Any],
+        masked_text: str,
+        structured_output: Dict[str, Any],
+        fhir_bundle: Dict[str, Any],
+        resource_counts: Dict[str, int]
+    ) -> Dict[str, Any]:
         """
-        Process multiple conversations in batch
+        Validate the FHIR bundle and assemble the final output (stages 3-4)
 
         Args:
-            conversation_list: List of conversation texts
+            result: The in-progress result from _run_claude_stages
+            masked_text: The de-identified conversation
+            structured_output: The validated Claude output
+            fhir_bundle: The transformed FHIR bundle
+            resource_counts: Resources created in the bundle
 
         Returns:
-            List of processing results
+            The completed result dictionary
         """
-        results = []
-        for i, conversation in enumerate(conversation_list, 1):
-            print(f"\n[{i}/{len(conversation_list)}] Processing conversation...")
-            result = self.process_conversation(conversation)
-            results.append(result)
+        transaction_id = result['transaction_id']
 
-        return results
+        # Validate FHIR bundle
+        is_valid, validation_errors = self.fhir_transformer.validate_fhir_bundle(fhir_bundle)
+
+        if not is_valid:
+            logger.warning('fhir_validation_warnings', extra={
+                'transaction_id': transaction_id,
+                'errors': validation_errors
+            })
+
+        result['stages']['fhir_transformation'] = {
+            'status': 'success',
+            'resource_counts': resource_counts,
+            'bundle_id': fhir_bundle.get('id'),
+            'validation_passed': is_valid
+        }
+
+        logger.info('fhir_transformation_complete', extra={
+            'transaction_id': transaction_id,
+            'bundle_id': fhir_bundle.get('id'),
+            'resource_counts': {rt: count for rt, count in resource_counts.items() if count > 0}
+        })
+
+        # STAGE 4: Generate final output
+        logger.info('stage_start', extra={'stage': 4, 'transaction_id': transaction_id})
+
+        result['success'] = True
+        result['outputs'] = {
+            'masked_conversation': masked_text,
+            'structured_clinical_data': structured_output,
+            'fhir_bundle': fhir_bundle
+        }
+
+        logger.info('transaction_complete', extra={'transaction_id': transaction_id})
+
+        return result
+
+    @staticmethod
+    def _record_failure(result: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Mark a result as failed with the given error"""
+        error_msg = f"Processing failed: {str(error)}"
+        logger.error(
+            'transaction_failed',
+            extra={'transaction_id': result['transaction_id'], 'error': error_msg}
+        )
+
+        result['success'] = False
+        result['error'] = error_msg
+
+        return result
 
     def save_results(self, result: Dict[str, Any], output_dir: str = "output") -> str:
         """
@@ -230,40 +566,82 @@ class ClinicalNoteProcessor:
         transaction_id = result['transaction_id']
         result_file = output_path / f"result_{transaction_id}.json"
 
-        # Save JSON file (legacy support)
-        with open(result_file, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        # Save JSON file (legacy support); compact unless PRETTY_JSON is set
+        dump_options = orjson.OPT_INDENT_2 if os.getenv('PRETTY_JSON', 'false').lower() == 'true' else 0
+        file_result = result
+
+        # The FHIR bundle goes to its own file; the result file references it
+        # by relative path instead of embedding a second copy
+        fhir_bundle = result.get('outputs', {}).get('fhir_bundle')
+        if fhir_bundle is not None:
+            bundle_file = output_path / f"bundle_{transaction_id}.json"
+            _write_file_bytes(bundle_file, orjson.dumps(fhir_bundle, default=str, option=dump_options))
+            file_result = {
+                **result,
+                'outputs': {
+                    **result['outputs'],
+                    'fhir_bundle': {'$ref': bundle_file.name, 'id': fhir_bundle.get('id')}
+                }
+            }
 
-        print(f"✓ Results saved to: {result_file}")
+        _write_file_bytes(result_file, orjson.dumps(file_result, default=str, option=dump_options))
 
-        # Save FHIR bundle to MongoDB if available
-        if DB_AVAILABLE and 'outputs' in result and 'fhir_bundle' in result['outputs']:
-            try:
-                mongodb = get_mongodb_connection()
-                fhir_bundle = result['outputs']['fhir_bundle']
-                confidence_score = result['outputs'].get('confidence_score', 0)
+        logger.info('results_saved', extra={'transaction_id': transaction_id, 'path': str(result_file)})
 
-                # Save the FHIR bundle
-                mongodb.save_fhir_bundle(
-                    transaction_id=transaction_id,
-                    bundle=fhir_bundle,
-                    confidence_score=confidence_score,
-                    validation_status='passed' if result['outputs'].get('validation_passed', False) else 'failed'
-                )
+        # Queue FHIR bundle and note for MongoDB if available
+        if self.mongodb and 'outputs' in result and 'fhir_bundle' in result['outputs']:
+            stages = result.get('stages', {})
+            fhir_fields = {
+                'transaction_id': transaction_id,
+                'bundle': result['outputs']['fhir_bundle'],
+                'confidence_score': stages.get('claude_processing', {}).get('confidence_score', 0),
+                'validation_status': 'passed' if stages.get('fhir_transformation', {}).get('validation_passed', False) else 'failed'
+            }
+            note_fields = {
+                'transaction_id': transaction_id,
+                'masked_text': result['outputs'].get('masked_conversation', ''),
+                'structured_output': result['outputs'].get('structured_clinical_data', {}),
+                'original_text': None  # We don't store original PHI
+            }
+            with self._pending_lock:
+                self._pending_writes.append((fhir_fields, note_fields))
+                should_flush = len(self._pending_writes) >= self.mongo_flush_every
+            if should_flush:
+                self.flush_pending_writes()
 
-                # Save clinical note metadata
-                mongodb.save_clinical_note(
-                    transaction_id=transaction_id,
-                    masked_text=result['stages'].get('deidentification', {}).get('masked_text', ''),
-                    structured_output=result['outputs'].get('structured_clinical_data', {}),
-                    original_text=None  # We don't store original PHI
-                )
+        return str(result_file)
 
-                print(f"✓ FHIR bundle saved to MongoDB")
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to save to MongoDB: {e}")
+    def flush_pending_writes(self) -> int:
+        """
+        Write all buffered transactions to MongoDB
 
-        return str(result_file)
+        Returns:
+            Number of transactions written
+        """
+        with self._pending_lock:
+            pending, self._pending_writes = self._pending_writes, []
+        if not pending or not self.mongodb:
+            return 0
+
+        # One timestamp for the whole batch, taken as it is written
+        now = datetime.utcnow()
+        documents = [
+            (
+                self.mongodb.build_fhir_bundle_document(**fhir_fields, now=now),
+                self.mongodb.build_clinical_note_document(**note_fields, now=now),
+            )
+            for fhir_fields, note_fields in pending
+        ]
+        try:
+            saved = self.mongodb.save_transactions_bulk(documents)
+        except Exception as e:
+            saved = False
+            logger.warning('mongodb_save_failed', extra={'count': len(pending), 'error': str(e)})
+
+        if not saved:
+            return 0
+        logger.info('results_saved_mongodb', extra={'count': len(pending)})
+        return len(pending)
 
     def generate_audit_report(self, transaction_id: str) -> str:
         """
@@ -290,25 +668,28 @@ class ClinicalNoteProcessor:
         confidences = {}
 
         # Chief complaint confidence
-        chief_complaint = structured_output.get('encounter_summary', {}).get('chief_complaint', '')
+        summary = structured_output.get('encounter_summary')
+        chief_complaint = summary.get('chief_complaint', '') if isinstance(summary, dict) else ''
         confidences['chief_complaint'] = 90 if chief_complaint and chief_complaint != 'N/A' else 30
 
         # Vital signs confidence
-        vital_signs = structured_output.get('vital_signs_extracted', {})
-        non_na_vitals = sum(1 for v in vital_signs.values() if v and v != 'N/A')
+        vital_signs = structured_output.get('vital_signs_extracted')
+        vitals = vital_signs.values() if isinstance(vital_signs, dict) else ()
+        non_na_vitals = sum(1 for v in vitals if v and v != 'N/A')
         confidences['vital_signs'] = min(100, (non_na_vitals / 5) * 100)
 
+        entities = structured_output.get('clinical_entities')
+        if not isinstance(entities, dict):
+            entities = {}
+
         # Diagnoses confidence
-        diagnoses = structured_output.get('clinical_entities', {}).get('diagnoses_problems', [])
-        confidences['diagnoses'] = 85 if diagnoses else 20
+        confidences['diagnoses'] = 85 if entities.get('diagnoses_problems') else 20
 
         # Medications confidence
-        medications = structured_output.get('clinical_entities', {}).get('medication_requests_new_or_changed', [])
-        confidences['medications'] = 85 if medications else 20
+        confidences['medications'] = 85 if entities.get('medication_requests_new_or_changed') else 20
 
         # Allergies confidence
-        allergies = structured_output.get('clinical_entities', {}).get('allergies', [])
-        confidences['allergies'] = 80 if allergies else 50
+        confidences['allergies'] = 80 if entities.get('allergies') else 50
 
         # Assessment/Plan confidence
         assessment = structured_output.get('assessment_plan_draft', '')
@@ -317,69 +698,85 @@ class ClinicalNoteProcessor:
         return confidences
 
 
-def load_mock_conversations(filepath: str = "data/mock_conversations.json") -> list:
+def _write_file_bytes(path: Path, data: bytes):
     """
-    Load mock clinical conversations from JSON file
+    Write *data* to *path* with raw os.write calls (normally exactly one)
+
+    Skips Python's buffered file layer entirely, and creates result files
+    owner/group-readable only since they hold clinical data.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o640)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def load_mock_conversations(filepath: str = "data/mock_conversations.json") -> Iterator[str]:
+    """
+    Stream mock clinical conversations from a JSON file
+
+    Conversations are parsed and yielded one at a time, so memory use does
+    not grow with the size of the file.
 
     Args:
         filepath: Path to the mock conversations file
 
-    Returns:
-        List of conversation texts
+    Yields:
+        Conversation texts
     """
-    with open(filepath, 'r') as f:
-        data = json.load(f)
-
-    return [conv['conversation'] for conv in data]
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, 'item.conversation')
 
 
 def main():
     """Main entry point for the clinical note processor"""
+    configure_logging()
+    logger.info('pipeline_start', extra={'tool': 'HIPAA-Compliant Clinical Note Automation Tool'})
 
-    print("\n" + "="*80)
-    print("HIPAA-Compliant Clinical Note Automation Tool")
-    print("="*80)
+    try:
+        # Initialize processor; MongoDB writes are batched across conversations
+        processor = ClinicalNoteProcessor(mongo_flush_every=50)
+
+        # Load mock conversations (streamed; never held in memory as a list)
+        conversations_path = "data/mock_conversations.json"
+        if not os.path.isfile(conversations_path):
+            logger.error('mock_conversations.json not found')
+            sys.exit(1)
+
+        # Process conversations
+        total = successful = 0
+        for i, conversation in enumerate(load_mock_conversations(conversations_path), 1):
+            logger.info('conversation_start', extra={'index': i})
+
+            result = processor.process_conversation(conversation)
+            total += 1
+            successful += result['success']
+
+            # Save result
+            processor.save_results(result)
+
+            # Emit audit report
+            if result['success']:
+                audit_report = processor.generate_audit_report(result['transaction_id'])
+                logger.info(
+                    'audit_report',
+                    extra={'transaction_id': result['transaction_id'], 'report': audit_report}
+                )
 
-    # Initialize processor
-    processor = ClinicalNoteProcessor()
+        processor.flush_pending_writes()
 
-    # Load mock conversations
-    try:
-        conversations = load_mock_conversations()
-        print(f"\nLoaded {len(conversations)} mock clinical conversations")
-    except FileNotFoundError:
-        print("Error: mock_conversations.json not found")
-        sys.exit(1)
-
-    # Process conversations
-    results = []
-    for i, conversation in enumerate(conversations, 1):  # Process all conversations
-        print(f"\n\n{'#'*80}")
-        print(f"# CONVERSATION {i}/{len(conversations)}")
-        print(f"{'#'*80}")
-
-        result = processor.process_conversation(conversation)
-        results.append(result)
-
-        # Save result
-        processor.save_results(result)
-
-        # Print audit report
-        if result['success']:
-            audit_report = processor.generate_audit_report(result['transaction_id'])
-            print("\nAUDIT REPORT:")
-            print("-" * 40)
-            print(audit_report)
-
-    # Summary
-    print("\n" + "="*80)
-    print("PROCESSING SUMMARY")
-    print("="*80)
-    successful = sum(1 for r in results if r['success'])
-    print(f"Total conversations processed: {len(results)}")
-    print(f"Successful: {successful}")
-    print(f"Failed: {len(results) - successful}")
-    print("="*80 + "\n")
+        # Summary
+        logger.info('processing_summary', extra={
+            'total': total,
+            'successful': successful,
+            'failed': total - successful
+        })
+    finally:
+        shutdown_logging()
 
 
 if __name__ == "__main__":
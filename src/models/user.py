@@ -5,7 +5,7 @@ Handles user authentication and role-based access control
 
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from modules.database import PostgreSQLConnection
+from modules.database import get_postgres_connection
 from typing import Optional
 
 
@@ -47,9 +47,7 @@ class User(UserMixin):
                    first_name: Optional[str] = None, last_name: Optional[str] = None) -> Optional['User']:
         """Create a new user in the database"""
         try:
-            db = PostgreSQLConnection()
-            if not db.connect():
-                return None
+            db = get_postgres_connection()
 
             password_hash = generate_password_hash(password)
 
@@ -61,7 +59,6 @@ class User(UserMixin):
             params = (username, email, password_hash, role, first_name, last_name)
 
             result = db.execute_query(query, params)
-            db.disconnect()
 
             if result:
                 user_data = result[0]
@@ -83,13 +80,10 @@ class User(UserMixin):
     def get_user_by_id(user_id: int) -> Optional['User']:
         """Get user by ID"""
         try:
-            db = PostgreSQLConnection()
-            if not db.connect():
-                return None
+            db = get_postgres_connection()
 
             query = "SELECT id, username, email, role, first_name, last_name, is_active FROM users WHERE id = %s"
             result = db.execute_query(query, (user_id,))
-            db.disconnect()
 
             if result:
                 user_data = result[0]
@@ -111,13 +105,10 @@ class User(UserMixin):
     def get_user_by_username(username: str) -> Optional['User']:
         """Get user by username"""
         try:
-            db = PostgreSQLConnection()
-            if not db.connect():
-                return None
+            db = get_postgres_connection()
 
             query = "SELECT id, username, email, role, first_name, last_name, is_active FROM users WHERE username = %s"
             result = db.execute_query(query, (username,))
-            db.disconnect()
 
             if result:
                 user_data = result[0]
@@ -139,13 +130,10 @@ class User(UserMixin):
     def verify_credentials(username: str, password: str) -> Optional['User']:
         """Verify user credentials and return user if valid"""
         try:
-            db = PostgreSQLConnection()
-            if not db.connect():
-                return None
+            db = get_postgres_connection()
 
             query = "SELECT id, username, email, password_hash, role, first_name, last_name, is_active FROM users WHERE username = %s"
             result = db.execute_query(query, (username,))
-            db.disconnect()
 
             if not result:
                 return None
@@ -1,20 +1,32 @@
 """
 HIPAA-Compliant Clinical Note Automation Tool Modules
+
+Public names are resolved lazily (PEP 562) so that importing one submodule,
+e.g. ``modules.database`` from a web worker, does not pull in the Anthropic
+SDK and every other pipeline stage.
 """
 
-from .deidentification import create_deidentifier, DeIdentifier, PHIRedactionList
-from .audit_logger import create_audit_logger, AuditLogger
-from .claude_api import create_claude_api_wrapper, ClaudeAPIWrapper
-from .fhir_transformer import create_fhir_transformer, FHIRTransformer
-from .fhir_schemas import (
-    CLINICAL_NOTE_SCHEMA,
-    FHIR_PATIENT_SCHEMA,
-    FHIR_ENCOUNTER_SCHEMA,
-    FHIR_CONDITION_SCHEMA,
-    FHIR_MEDICATION_REQUEST_SCHEMA,
-    FHIR_BUNDLE_SCHEMA,
-    get_terminology_code
-)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'create_deidentifier': '.deidentification',
+    'DeIdentifier': '.deidentification',
+    'PHIRedactionList': '.deidentification',
+    'create_audit_logger': '.audit_logger',
+    'AuditLogger': '.audit_logger',
+    'create_claude_api_wrapper': '.claude_api',
+    'ClaudeAPIWrapper': '.claude_api',
+    'create_fhir_transformer': '.fhir_transformer',
+    'FHIRTransformer': '.fhir_transformer',
+    'CLINICAL_NOTE_SCHEMA': '.fhir_schemas',
+    'FHIR_PATIENT_SCHEMA': '.fhir_schemas',
+    'FHIR_ENCOUNTER_SCHEMA': '.fhir_schemas',
+    'FHIR_CONDITION_SCHEMA': '.fhir_schemas',
+    'FHIR_MEDICATION_REQUEST_SCHEMA': '.fhir_schemas',
+    'FHIR_BUNDLE_SCHEMA': '.fhir_schemas',
+    'get_terminology_code': '.fhir_schemas',
+}
 
 __all__ = [
     'create_deidentifier',
@@ -34,3 +46,17 @@ __all__ = [
     'FHIR_BUNDLE_SCHEMA',
     'get_terminology_code'
 ]
+
+
+def __getattr__(name):
+    """Import the defining submodule on first access and cache the value"""
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,12 +4,106 @@ Logs all API calls, de-identification steps, and FHIR transformations
 Supports both file-based (legacy) and database-backed (PostgreSQL) logging
 """
 
+import atexit
+import glob
+import io
 import json
+import logging
 import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional
+from logging.handlers import QueueListener
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import uuid
 
+# fcntl (POSIX) serialises writes and rotation between processes sharing a
+# log file, e.g. gunicorn workers; elsewhere only in-process locking applies
+try:
+    import fcntl
+    _FCNTL_AVAILABLE = True
+except ImportError:
+    _FCNTL_AVAILABLE = False
+
+# orjson encodes audit entries straight to compact bytes, several times
+# faster than the stdlib encoder; fall back to json when it is missing
+try:
+    import orjson
+
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, separators=(',', ':')).encode('utf-8')
+
+    _loads = json.loads
+
+# zstandard is optional; without it rotated logs are kept uncompressed
+try:
+    import zstandard
+    _ZSTD_AVAILABLE = True
+except ImportError:
+    _ZSTD_AVAILABLE = False
+
+# (second, 'YYYY-MM-DDTHH:MM:SS') of the most recent timestamp; events
+# logged within the same second reuse the formatted date/time prefix
+_ts_prefix: Tuple[int, str] = (-1, '')
+
+
+def _ts() -> str:
+    """Current UTC time as an ISO 8601 string with millisecond precision"""
+    global _ts_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _ts_prefix
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _ts_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}Z"
+
+
+class _RateLimitFilter(logging.Filter):
+    """
+    Pass at most max_per_second records per one-second window
+
+    When PostgreSQL is down every flush fails; this keeps those warnings
+    from flooding the log. The first record let through after a dropped
+    run carries the number dropped as its 'suppressed' attribute.
+    """
+
+    def __init__(self, max_per_second: int = 5):
+        super().__init__()
+        self.max_per_second = max_per_second
+        self._window = 0
+        self._count = 0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        window = int(record.created)
+        with self._lock:
+            if window != self._window:
+                self._window = window
+                self._count = 0
+            if self._count >= self.max_per_second:
+                self._suppressed += 1
+                return False
+            self._count += 1
+            if self._suppressed:
+                record.suppressed = self._suppressed
+                self._suppressed = 0
+        return True
+
+
+# Never routed back into AuditLogger, so a failing sink cannot recurse
+logger = logging.getLogger(__name__)
+logger.addFilter(_RateLimitFilter())
+
 # Try to import database module; fall back to file-based if not available
 try:
     from .database import get_postgres_connection
@@ -18,22 +112,377 @@ except (ImportError, Exception):
     DB_AVAILABLE = False
 
 
+def _format_deidentification(event: Dict[str, Any], write: Callable[[str], Any]):
+    write(f"  - Redactions: {event.get('redactions', {})}\n")
+    write(f"  - Validation Safe: {event.get('validation_safe', False)}\n")
+
+
+def _format_claude_api_call(event: Dict[str, Any], write: Callable[[str], Any]):
+    write(f"  - Model: {event.get('model', 'N/A')}\n")
+    write(f"  - Status: {event.get('status', 'N/A')}\n")
+
+
+def _format_fhir_transformation(event: Dict[str, Any], write: Callable[[str], Any]):
+    write(f"  - Validation Passed: {event.get('validation_passed', False)}\n")
+    write(f"  - Resources Created: {event.get('resources_created', {})}\n")
+
+
+def _format_confidence_scoring(event: Dict[str, Any], write: Callable[[str], Any]):
+    write(f"  - Overall Confidence: {event.get('overall_confidence', 0)}%\n")
+    write(f"  - Requires Review: {event.get('requires_human_review', False)}\n")
+
+
+# Per-event-type detail lines for export_audit_report
+_REPORT_FORMATTERS: Dict[str, Callable[[Dict[str, Any], Callable[[str], Any]], None]] = {
+    'de_identification': _format_deidentification,
+    'claude_api_call': _format_claude_api_call,
+    'fhir_transformation': _format_fhir_transformation,
+    'confidence_scoring': _format_confidence_scoring,
+}
+
+
+# Low-cardinality fields repeated on nearly every entry. Their values are
+# interned so thousands of buffered or decoded entries share one str object
+# per distinct value instead of holding their own copies
+_INTERNED_FIELDS: Tuple[str, ...] = ('event_type', 'stage', 'status', 'model', 'model_used')
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern *value* if it is a plain str; return anything else unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_fields(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Intern the low-cardinality string values of *entry* in place"""
+    for field in _INTERNED_FIELDS:
+        if field in entry:
+            entry[field] = _intern(entry[field])
+    return entry
+
+
+def _rotated_log_paths(filepath: str) -> List[str]:
+    """
+    Return the rotated segments of *filepath*, oldest first
+
+    Segments are named '<file>.<UTC stamp>', plus '.zst' once compressed.
+    While a segment is being compressed both forms exist briefly; the
+    uncompressed one wins so no entry is read twice.
+    """
+    paths = set(glob.glob(glob.escape(filepath) + '.*'))
+    return sorted(
+        path for path in paths
+        if not (path.endswith('.zst') and path[:-len('.zst')] in paths)
+    )
+
+
+def _open_log_segment(path: str) -> Optional[io.BufferedIOBase]:
+    """Open a current or rotated log segment for binary line reading"""
+    if not path.endswith('.zst'):
+        return open(path, 'rb')
+    if not _ZSTD_AVAILABLE:
+        logger.warning("zstandard is not installed; skipping rotated audit log %s", path)
+        return None
+    return io.BufferedReader(
+        zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    )
+
+
+def _compress_log_segment(path: str):
+    """Replace a rotated segment with a zstd-compressed copy (level 3)"""
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.zst.tmp")
+    fd = os.open(tmp_path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o600)
+    try:
+        with open(path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+            zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+        os.replace(tmp_path, path + '.zst')
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.remove(path)
+
+
+class _AuditRecord:
+    """
+    Queue item for the audit listener
+
+    Stands in for a logging.LogRecord: the audit handlers only read these
+    attributes, so building a full LogRecord per event would be wasted work.
+    """
+
+    __slots__ = ('audit_file', 'audit_entry', 'db_event', 'flush_done')
+
+    def __init__(
+        self,
+        audit_file: Optional[str] = None,
+        audit_entry: Optional[Dict[str, Any]] = None,
+        db_event: Optional[Dict[str, Any]] = None,
+        flush_done: Optional[threading.Event] = None
+    ):
+        self.audit_file = audit_file
+        self.audit_entry = audit_entry
+        self.db_event = db_event
+        self.flush_done = flush_done
+
+
+@contextmanager
+def _interprocess_lock(fd: int) -> Iterator[None]:
+    """Hold an exclusive flock() on *fd* for the duration of the block"""
+    if not _FCNTL_AVAILABLE:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class _JsonlFileHandler(logging.Handler):
+    """
+    Appends the entries of one audit stream to its JSONL file
+
+    The file is opened once; entries are encoded straight into one
+    bytearray and written with a single os.write() when 64 KB is pending or the listener flushes an
+    idle queue. Each stream (audit, transaction) has its own handler, file
+    and lock.
+
+    Once the file reaches max_bytes it is rotated and, when zstandard is
+    installed, compressed. Writes and rotation happen under a flock() on a
+    sidecar lock file, and a writer whose file was rotated by another
+    process reopens it first, so no entry lands in a rotated segment.
+    """
+
+    BUFFER_SIZE = 65536
+
+    def __init__(self, filepath: str, fsync: bool = False, max_bytes: int = 0):
+        super().__init__()
+        self.filepath = filepath
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self._pending = bytearray()
+        directory, name = os.path.split(filepath)
+        self._lock_fd: Optional[int] = os.open(
+            os.path.join(directory, f".{name}.lock"), os.O_CREAT | os.O_RDWR, 0o600
+        )
+        self._fd: Optional[int] = None
+        self._open()
+
+    def _open(self):
+        self._fd = os.open(self.filepath, os.O_CREAT | os.O_APPEND | os.O_WRONLY, 0o600)
+
+    def _file_replaced(self) -> bool:
+        try:
+            current = os.stat(self.filepath)
+        except FileNotFoundError:
+            return True
+        opened = os.fstat(self._fd)
+        return (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino)
+
+    def emit(self, record: _AuditRecord):
+        if record.audit_file != self.filepath:
+            return
+        pending = self._pending
+        pending += _dumps(record.audit_entry)
+        pending += b'\n'
+        if len(pending) >= self.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self._pending or self._fd is None:
+                return
+            # Write from a view of the batch buffer: no joined copy
+            data = memoryview(self._pending)
+            self._pending = bytearray()
+
+            rotated = None
+            with _interprocess_lock(self._lock_fd):
+                if self._file_replaced():
+                    os.close(self._fd)
+                    self._open()
+                while data:
+                    data = data[os.write(self._fd, data):]
+                if self.fsync:
+                    os.fdatasync(self._fd)
+                if self.max_bytes and os.fstat(self._fd).st_size >= self.max_bytes:
+                    rotated = self._rotate()
+
+            if rotated and _ZSTD_AVAILABLE:
+                try:
+                    _compress_log_segment(rotated)
+                except Exception as e:
+                    logger.warning("Failed to compress rotated audit log %s: %s", rotated, e)
+
+    def _rotate(self) -> str:
+        """Move the current file aside and start a new one (caller holds the flock)"""
+        now = time.time()
+        stamp = time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))
+        rotated = f"{self.filepath}.{stamp}{int((now % 1) * 1e6):06d}Z"
+        os.replace(self.filepath, rotated)
+        os.close(self._fd)
+        self._open()
+        return rotated
+
+    def close(self):
+        with self.lock:
+            try:
+                self.flush()
+            finally:
+                for fd in (self._fd, self._lock_fd):
+                    if fd is not None:
+                        os.close(fd)
+                self._fd = self._lock_fd = None
+                super().close()
+
+
+class _PostgresAuditHandler(logging.Handler):
+    """Buffers audit events and writes them with one multi-row INSERT"""
+
+    def __init__(self, db, max_buffer: int):
+        super().__init__()
+        self._db = db
+        self.max_buffer = max_buffer
+        self._pending: List[Dict[str, Any]] = []
+
+    def emit(self, record: _AuditRecord):
+        if record.db_event is None:
+            return
+        self._pending.append(record.db_event)
+        if len(self._pending) >= self.max_buffer:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            events, self._pending = self._pending, []
+            if not events:
+                return
+            try:
+                self._db.log_audit_events_bulk(events)
+            except Exception as e:
+                logger.warning("Failed to log to PostgreSQL: %s", e)
+
+    def discard(self):
+        """Drop pending events without writing them"""
+        with self.lock:
+            self._pending = []
+
+
+class _AuditQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever the queue runs dry
+
+    Entries that arrive while a batch is being written accumulate in the
+    queue and go out together in the next batch, so the batch size adapts
+    to the event rate without any timer.
+    """
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+    def handle(self, record):
+        if record.flush_done is not None:
+            for handler in self.handlers:
+                handler.flush()
+            record.flush_done.set()
+            return
+        super().handle(record)
+
+
 class AuditLogger:
     """Manages compliance audit trails for the clinical scribe system"""
 
-    def __init__(self, log_dir: str = "src/logs"):
+    # Upper bound on how long flush() waits for the listener thread
+    FLUSH_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        log_dir: str = "src/logs",
+        max_buffer: int = 128,
+        fsync: Optional[bool] = None,
+        max_bytes: Optional[int] = None
+    ):
         self.log_dir = log_dir
         os.makedirs(log_dir, exist_ok=True)
-        self.audit_log_file = os.path.join(log_dir, "audit_log.json")
-        self.transaction_log_file = os.path.join(log_dir, "transaction_log.json")
+        # Append-only JSON Lines logs: one event per line, never rewritten
+        self.audit_log_file = os.path.join(log_dir, "audit_log.jsonl")
+        self.transaction_log_file = os.path.join(log_dir, "transaction_log.jsonl")
         self.ensure_log_files_exist()
 
+        # Shared pooled PostgreSQL handle, resolved once per logger
+        self._db = get_postgres_connection() if DB_AVAILABLE else None
+
+        # log_* calls only put the entry on a queue; a background listener
+        # encodes and writes it to the JSONL files and to PostgreSQL (in
+        # batches of up to max_buffer). With fsync (AUDIT_LOG_FSYNC), each
+        # file flush is followed by fdatasync()
+        self.max_buffer = max_buffer
+        if fsync is None:
+            fsync = os.getenv('AUDIT_LOG_FSYNC', 'false').lower() == 'true'
+        self.fsync = fsync
+        # Log files are rotated at max_bytes (AUDIT_LOG_MAX_BYTES, 0 = never)
+        if max_bytes is None:
+            max_bytes = int(os.getenv('AUDIT_LOG_MAX_BYTES', 100 * 1024 * 1024))
+        self.max_bytes = max_bytes
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._listener: Optional[_AuditQueueListener] = None
+        self._start_listener()
+        atexit.register(self.close)
+        # Threads do not survive fork(); workers forked from a preloaded
+        # app start their own listener. File buffers are flushed (and locked)
+        # across the fork so the child never re-writes the parent's data.
+        os.register_at_fork(
+            before=self._before_fork,
+            after_in_parent=self._after_fork_in_parent,
+            after_in_child=self._after_fork_in_child,
+        )
+
+    def __enter__(self) -> 'AuditLogger':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _start_listener(self):
+        """Start a fresh queue, handler set and listener thread"""
+        handlers: List[logging.Handler] = [
+            _JsonlFileHandler(self.audit_log_file, self.fsync, self.max_bytes),
+            _JsonlFileHandler(self.transaction_log_file, self.fsync, self.max_bytes),
+        ]
+        if self._db is not None:
+            handlers.append(_PostgresAuditHandler(self._db, self.max_buffer))
+        self._queue = queue.SimpleQueue()
+        self._listener = _AuditQueueListener(self._queue, *handlers)
+        self._listener.start()
+
     def ensure_log_files_exist(self):
-        """Create log files if they don't exist"""
-        for log_file in [self.audit_log_file, self.transaction_log_file]:
-            if not os.path.exists(log_file):
-                with open(log_file, 'w') as f:
-                    json.dump([], f, indent=2)
+        """Create log files if they don't exist, carrying over legacy JSON-array logs"""
+        for log_file in (self.audit_log_file, self.transaction_log_file):
+            # O_EXCL makes creation atomic: when several loggers start at
+            # once, exactly one creates (and seeds) each file
+            try:
+                fd = os.open(log_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, 'wb') as f:
+                self._migrate_legacy_log(log_file[:-len('l')], f)
+
+    @staticmethod
+    def _migrate_legacy_log(legacy_path: str, out):
+        """Copy the entries of a legacy JSON-array log, if present, into *out* as JSON Lines"""
+        try:
+            with open(legacy_path, 'rb') as f:
+                entries = _loads(f.read())
+        except (json.JSONDecodeError, IOError):
+            return
+        for entry in entries:
+            out.write(_dumps(entry) + b'\n')
 
     def log_transaction(
         self,
@@ -61,23 +510,21 @@ class AuditLogger:
             transaction_id
         """
         if transaction_id is None:
-            transaction_id = str(uuid.uuid4())
+            transaction_id = uuid.uuid4().hex
 
         transaction_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _ts(),
             'transaction_id': transaction_id,
-            'stage': stage,
-            'status': status,
+            'stage': _intern(stage),
+            'status': _intern(status),
             'input_length': input_length,
             'output_length': output_length,
-            'model_used': model_used,
+            'model_used': _intern(model_used),
             'metadata': metadata or {}
         }
 
         # Append to transaction log
-        transactions = self._read_json_log(self.transaction_log_file)
-        transactions.append(transaction_entry)
-        self._write_json_log(self.transaction_log_file, transactions)
+        self._enqueue(self.transaction_log_file, transaction_entry)
 
         return transaction_id
 
@@ -91,7 +538,7 @@ class AuditLogger:
     ):
         """Log de-identification activity to both JSON (legacy) and PostgreSQL"""
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _ts(),
             'transaction_id': transaction_id,
             'event_type': 'de_identification',
             'original_length': original_length,
@@ -102,27 +549,21 @@ class AuditLogger:
         }
 
         # Log to JSON (legacy support)
-        audit_log = self._read_json_log(self.audit_log_file)
-        audit_log.append(entry)
-        self._write_json_log(self.audit_log_file, audit_log)
-
-        # Log to PostgreSQL if available
-        if DB_AVAILABLE:
-            try:
-                db = get_postgres_connection()
-                db.log_audit_event(
-                    transaction_id=transaction_id,
-                    event_type='de_identification',
-                    status='success',
-                    details={
-                        'original_length': original_length,
-                        'masked_length': masked_length,
-                        'redaction_counts': redaction_counts,
-                        'validation_report': validation_report
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to log to PostgreSQL: {e}")
+        self._enqueue(self.audit_log_file, entry)
+
+        # Queue for PostgreSQL if available
+        if self._db is not None:
+            self._enqueue_db(
+                transaction_id=transaction_id,
+                event_type='de_identification',
+                status='success',
+                details={
+                    'original_length': original_length,
+                    'masked_length': masked_length,
+                    'redaction_counts': redaction_counts,
+                    'validation_report': validation_report
+                }
+            )
 
     def log_claude_api_call(
         self,
@@ -133,46 +574,44 @@ class AuditLogger:
         max_tokens: int,
         temperature: float,
         status: str = "success",
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        cache_read_input_tokens: Optional[int] = None
     ):
         """Log Claude API call details to both JSON (legacy) and PostgreSQL"""
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _ts(),
             'transaction_id': transaction_id,
             'event_type': 'claude_api_call',
-            'model': model,
+            'model': _intern(model),
             'prompt_length': prompt_length,
             'response_length': response_length,
             'max_tokens': max_tokens,
             'temperature': temperature,
-            'status': status,
+            'status': _intern(status),
             'error_message': error_message
         }
+        if cache_read_input_tokens is not None:
+            entry['cache_read_input_tokens'] = cache_read_input_tokens
 
         # Log to JSON (legacy support)
-        audit_log = self._read_json_log(self.audit_log_file)
-        audit_log.append(entry)
-        self._write_json_log(self.audit_log_file, audit_log)
-
-        # Log to PostgreSQL if available
-        if DB_AVAILABLE:
-            try:
-                db = get_postgres_connection()
-                db.log_audit_event(
-                    transaction_id=transaction_id,
-                    event_type='claude_api_call',
-                    status=status,
-                    details={
-                        'model': model,
-                        'prompt_length': prompt_length,
-                        'response_length': response_length,
-                        'max_tokens': max_tokens,
-                        'temperature': temperature,
-                        'error_message': error_message
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to log to PostgreSQL: {e}")
+        self._enqueue(self.audit_log_file, entry)
+
+        # Queue for PostgreSQL if available
+        if self._db is not None:
+            self._enqueue_db(
+                transaction_id=transaction_id,
+                event_type='claude_api_call',
+                status=status,
+                details={
+                    'model': model,
+                    'prompt_length': prompt_length,
+                    'response_length': response_length,
+                    'max_tokens': max_tokens,
+                    'temperature': temperature,
+                    'error_message': error_message,
+                    'cache_read_input_tokens': cache_read_input_tokens
+                }
+            )
 
     def log_fhir_transformation(
         self,
@@ -185,7 +624,7 @@ class AuditLogger:
     ):
         """Log FHIR transformation and validation to both JSON (legacy) and PostgreSQL"""
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _ts(),
             'transaction_id': transaction_id,
             'event_type': 'fhir_transformation',
             'llm_output_length': llm_output_length,
@@ -196,28 +635,22 @@ class AuditLogger:
         }
 
         # Log to JSON (legacy support)
-        audit_log = self._read_json_log(self.audit_log_file)
-        audit_log.append(entry)
-        self._write_json_log(self.audit_log_file, audit_log)
-
-        # Log to PostgreSQL if available
-        if DB_AVAILABLE:
-            try:
-                db = get_postgres_connection()
-                db.log_audit_event(
-                    transaction_id=transaction_id,
-                    event_type='fhir_transformation',
-                    status='success' if validation_passed else 'failure',
-                    details={
-                        'llm_output_length': llm_output_length,
-                        'fhir_bundle_length': fhir_bundle_length,
-                        'resources_created': resources_created,
-                        'validation_passed': validation_passed,
-                        'schema_errors': schema_errors
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to log to PostgreSQL: {e}")
+        self._enqueue(self.audit_log_file, entry)
+
+        # Queue for PostgreSQL if available
+        if self._db is not None:
+            self._enqueue_db(
+                transaction_id=transaction_id,
+                event_type='fhir_transformation',
+                status='success' if validation_passed else 'failure',
+                details={
+                    'llm_output_length': llm_output_length,
+                    'fhir_bundle_length': fhir_bundle_length,
+                    'resources_created': resources_created,
+                    'validation_passed': validation_passed,
+                    'schema_errors': schema_errors
+                }
+            )
 
     def log_confidence_scoring(
         self,
@@ -228,7 +661,7 @@ class AuditLogger:
     ):
         """Log confidence scoring for extracted data to both JSON (legacy) and PostgreSQL"""
         entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _ts(),
             'transaction_id': transaction_id,
             'event_type': 'confidence_scoring',
             'overall_confidence': overall_confidence,
@@ -238,32 +671,29 @@ class AuditLogger:
         }
 
         # Log to JSON (legacy support)
-        audit_log = self._read_json_log(self.audit_log_file)
-        audit_log.append(entry)
-        self._write_json_log(self.audit_log_file, audit_log)
-
-        # Log to PostgreSQL if available
-        if DB_AVAILABLE:
-            try:
-                db = get_postgres_connection()
-                db.log_audit_event(
-                    transaction_id=transaction_id,
-                    event_type='confidence_scoring',
-                    status='success',
-                    details={
-                        'overall_confidence': overall_confidence,
-                        'field_confidences': field_confidences,
-                        'low_confidence_fields': low_confidence_fields,
-                        'requires_human_review': len(low_confidence_fields) > 0
-                    }
-                )
-            except Exception as e:
-                print(f"⚠️  Warning: Failed to log to PostgreSQL: {e}")
+        self._enqueue(self.audit_log_file, entry)
+
+        # Queue for PostgreSQL if available
+        if self._db is not None:
+            self._enqueue_db(
+                transaction_id=transaction_id,
+                event_type='confidence_scoring',
+                status='success',
+                details={
+                    'overall_confidence': overall_confidence,
+                    'field_confidences': field_confidences,
+                    'low_confidence_fields': low_confidence_fields,
+                    'requires_human_review': len(low_confidence_fields) > 0
+                }
+            )
 
     def get_transaction_summary(self, transaction_id: str) -> Dict:
         """Get a complete summary of a transaction"""
-        audit_log = self._read_json_log(self.audit_log_file)
-        transaction_events = [e for e in audit_log if e.get('transaction_id') == transaction_id]
+        self.flush()
+        transaction_events = [
+            e for e in self._iter_jsonl(self.audit_log_file)
+            if e.get('transaction_id') == transaction_id
+        ]
 
         summary = {
             'transaction_id': transaction_id,
@@ -274,20 +704,78 @@ class AuditLogger:
 
         return summary
 
-    def _read_json_log(self, filepath: str) -> list:
-        """Read JSON log file"""
-        if not os.path.exists(filepath):
-            return []
-        try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return []
-
-    def _write_json_log(self, filepath: str, data: list):
-        """Write JSON log file"""
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _iter_jsonl(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """Yield the entries of a JSON Lines log and its rotated segments, oldest first"""
+        for segment in _rotated_log_paths(filepath) + [filepath]:
+            try:
+                f = _open_log_segment(segment)
+            except FileNotFoundError:
+                continue
+            if f is None:
+                continue
+            with f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    yield _intern_fields(entry) if type(entry) is dict else entry
+
+    def _enqueue(self, filepath: str, entry: Dict[str, Any]):
+        """Queue a JSON Lines log entry for the listener thread"""
+        self._queue.put_nowait(_AuditRecord(audit_file=filepath, audit_entry=entry))
+
+    def _enqueue_db(self, **event: Any):
+        """Queue a PostgreSQL audit event for the listener thread"""
+        event['created_at'] = datetime.utcnow()
+        self._queue.put_nowait(_AuditRecord(db_event=event))
+
+    def flush(self):
+        """Block until every entry queued so far has been written"""
+        if self._listener is None:
+            return
+        done = threading.Event()
+        self._queue.put_nowait(_AuditRecord(flush_done=done))
+        done.wait(self.FLUSH_TIMEOUT)
+
+    def _before_fork(self):
+        if self._listener is None:
+            return
+        for handler in self._listener.handlers:
+            handler.acquire()
+            if isinstance(handler, _JsonlFileHandler):
+                handler.flush()
+
+    def _after_fork_in_parent(self):
+        if self._listener is None:
+            return
+        for handler in self._listener.handlers:
+            handler.release()
+
+    def _after_fork_in_child(self):
+        if self._listener is None:
+            return
+        # The inherited listener thread is gone; close the inherited file
+        # handles (their buffers were flushed) and drop the parent's pending
+        # PostgreSQL batch before starting over
+        for handler in self._listener.handlers:
+            handler.createLock()
+            if isinstance(handler, _PostgresAuditHandler):
+                handler.discard()
+            handler.close()
+        self._start_listener()
+
+    def close(self):
+        """Drain the queue, write any pending batch and stop the listener thread"""
+        listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+            handler.close()
 
     def export_audit_report(self, transaction_id: Optional[str] = None) -> str:
         """
@@ -299,43 +787,40 @@ class AuditLogger:
         Returns:
             Formatted audit report string
         """
-        # Read from both transaction log and audit log
-        audit_log = self._read_json_log(self.audit_log_file)
-        transaction_log = self._read_json_log(self.transaction_log_file)
-
-        # Combine both logs
-        audit_log.extend(transaction_log)
-
-        if transaction_id:
-            audit_log = [e for e in audit_log if e.get('transaction_id') == transaction_id]
-
-        report = "=== AUDIT REPORT ===\n"
-        report += f"Generated: {datetime.now().isoformat()}\n"
-        report += f"Total Events: {len(audit_log)}\n\n"
-
-        for event in audit_log:
-            report += f"Timestamp: {event['timestamp']}\n"
-            report += f"Event Type: {event.get('event_type', 'N/A')}\n"
-            report += f"Transaction ID: {event.get('transaction_id', 'N/A')}\n"
-
-            if event.get('event_type') == 'de_identification':
-                report += f"  - Redactions: {event.get('redactions', {})}\n"
-                report += f"  - Validation Safe: {event.get('validation_safe', False)}\n"
-            elif event.get('event_type') == 'claude_api_call':
-                report += f"  - Model: {event.get('model', 'N/A')}\n"
-                report += f"  - Status: {event.get('status', 'N/A')}\n"
-            elif event.get('event_type') == 'fhir_transformation':
-                report += f"  - Validation Passed: {event.get('validation_passed', False)}\n"
-                report += f"  - Resources Created: {event.get('resources_created', {})}\n"
-            elif event.get('event_type') == 'confidence_scoring':
-                report += f"  - Overall Confidence: {event.get('overall_confidence', 0)}%\n"
-                report += f"  - Requires Review: {event.get('requires_human_review', False)}\n"
-
-            report += "\n"
-
-        return report
-
-
-def create_audit_logger(log_dir: str = "src/logs") -> AuditLogger:
+        self.flush()
+
+        body = io.StringIO()
+        write = body.write
+        total_events = 0
+
+        # Stream both audit log and transaction log
+        for log_file in (self.audit_log_file, self.transaction_log_file):
+            for event in self._iter_jsonl(log_file):
+                if transaction_id and event.get('transaction_id') != transaction_id:
+                    continue
+                total_events += 1
+                event_type = event.get('event_type')
+                write(f"Timestamp: {event['timestamp']}\n")
+                write(f"Event Type: {event.get('event_type', 'N/A')}\n")
+                write(f"Transaction ID: {event.get('transaction_id', 'N/A')}\n")
+                formatter = _REPORT_FORMATTERS.get(event_type)
+                if formatter is not None:
+                    formatter(event, write)
+                write("\n")
+
+        header = (
+            "=== AUDIT REPORT ===\n"
+            f"Generated: {datetime.now().isoformat()}\n"
+            f"Total Events: {total_events}\n\n"
+        )
+        return header + body.getvalue()
+
+
+def create_audit_logger(
+    log_dir: str = "src/logs",
+    max_buffer: int = 128,
+    fsync: Optional[bool] = None,
+    max_bytes: Optional[int] = None
+) -> AuditLogger:
     """Factory function to create an AuditLogger instance"""
-    return AuditLogger(log_dir)
+    return AuditLogger(log_dir, max_buffer, fsync, max_bytes)
@@ -4,20 +4,592 @@ Handles all interactions with Claude API for clinical note processing
 Uses structured outputs for guaranteed JSON compliance
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import math
 import os
 import re
-from typing import Any, Dict, Optional, Tuple
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import anthropic
+import httpx
+
+# HTTP/2 (multiplexed requests over one connection) needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# orjson decodes Claude responses several times faster; its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers catch either the same way
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 
-from .fhir_schemas import CLINICAL_NOTE_SCHEMA
 from .audit_logger import AuditLogger
 
 logger = logging.getLogger(__name__)
 
 
+# Prompts are invariant apart from the conversation itself, so they are
+# built once; the user message is a plain prefix + conversation + suffix
+_SYSTEM_PROMPT = (
+    'Extract clinical data from de-identified conversation. '
+    'Output MUST be valid JSON.\n\n'
+    'Rules:\n'
+    '- NEVER include patient names, dates, or identifiers\n'
+    '- Only extract explicitly stated facts\n'
+    "- Use 'N/A' for missing fields\n"
+    '- Return a JSON object with: encounter_summary, vital_signs_extracted, '
+    'clinical_entities, assessment_plan_draft, ai_confidence_score, flagged_for_review'
+)
+
+# System prompt as a content block with a cache breakpoint, so the
+# invariant prefix is read from Anthropic's prompt cache (billed at 0.1x)
+# once it is long enough to be cached
+_SYSTEM_BLOCKS = [
+    {'type': 'text', 'text': _SYSTEM_PROMPT, 'cache_control': {'type': 'ephemeral'}},
+]
+
+_USER_MESSAGE_PREFIX = 'Extract JSON from this clinical conversation (de-identified):\n\n'
+
+_USER_MESSAGE_SUFFIX = (
+    '\n\n'
+    'Return JSON with:\n'
+    '- encounter_summary: {chief_complaint, history_of_present_illness}\n'
+    '- vital_signs_extracted: {blood_pressure, temperature, heart_rate}\n'
+    '- clinical_entities: {diagnoses_problems[], medication_requests_new_or_changed[], allergies[]}\n'
+    '- assessment_plan_draft: string\n'
+    '- ai_confidence_score: 1-100\n'
+    '- flagged_for_review: boolean\n\n'
+    'Only extract stated facts.'
+)
+
+# Folded into every response-cache key, so editing a prompt invalidates
+# cached responses (in memory and on disk) without a manual version bump
+_PROMPT_FINGERPRINT = hashlib.blake2b(
+    (_SYSTEM_PROMPT + '\0' + _USER_MESSAGE_PREFIX + '\0' + _USER_MESSAGE_SUFFIX).encode(), digest_size=8
+).digest()
+
+# Multiplexed requests pack several conversations into one user message
+# and ask for a JSON array back, one object per conversation
+_MULTIPLEX_PREFIX = (
+    'Extract JSON from each of these clinical conversations (de-identified). '
+    'Return a JSON array with one object per conversation, each with an "index" '
+    'field equal to its CONVERSATION number.\n\n'
+)
+
+# Multiplexed replies come from a different prompt, so they are cached under
+# their own fingerprint and never served to single-conversation calls
+_MULTIPLEX_PROMPT_FINGERPRINT = hashlib.blake2b(
+    (_SYSTEM_PROMPT + '\0' + _MULTIPLEX_PREFIX + '\0' + _USER_MESSAGE_SUFFIX).encode(), digest_size=8
+).digest()
+
+# Packing limits for multiplexed requests (context window / output budget)
+_MULTIPLEX_MAX_INPUT_TOKENS = 150_000
+_MULTIPLEX_MAX_OUTPUT_TOKENS = 64_000
+
+# Outermost JSON array in a multiplexed reply: fenced or bare
+_JSON_ARRAY_RE = re.compile(r'```(?:json)?\s*(\[.*\])\s*```|(\[.*\])', re.DOTALL)
+
+# Characters that can change brace depth or string state while scanning
+_JSON_STRUCTURAL_RE = re.compile(r'[{}"\\]')
+
+# ...plus the separators the streamed-field scanner also needs
+_JSON_FIELD_STRUCTURAL_RE = re.compile(r'[{}\[\]":,\\]')
+
+# Keep-alive pool shared by every Claude call in the process; the hard cap
+# keeps a burst of concurrent batches from opening a connection storm
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=50, keepalive_expiry=60.0
+)
+
+# Fail fast on an unreachable endpoint; streamed reads only wait between
+# chunks, so a long generation never trips the read timeout
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# The SDK retries 429/5xx/connection errors itself with jittered exponential
+# backoff, sleeping exactly as long as a retry-after header asks
+_MAX_RETRIES = int(os.getenv('CLAUDE_MAX_RETRIES', '4'))
+
+# One SDK client per API key and process, so repeated ClaudeAPIWrapper
+# construction reuses the same pooled TCP/TLS connections
+_shared_clients: Dict[str, anthropic.Anthropic] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(api_key: str) -> anthropic.Anthropic:
+    """Get or create the process-wide Anthropic client for *api_key*."""
+    client = _shared_clients.get(api_key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(api_key)
+            if client is None:
+                client = anthropic.Anthropic(
+                    api_key=api_key,
+                    timeout=_HTTP_TIMEOUT,
+                    max_retries=_MAX_RETRIES,
+                    http_client=anthropic.DefaultHttpxClient(
+                        http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS
+                    ),
+                )
+                _shared_clients[api_key] = client
+    return client
+
+
+# Async clients are bound to the event loop that opened their connections,
+# so they are shared per (event loop, API key); entries for loops that have
+# since been closed are dropped on the next lookup
+_shared_async_clients: Dict[asyncio.AbstractEventLoop, Dict[str, anthropic.AsyncAnthropic]] = {}
+
+
+def _get_shared_async_client(api_key: str) -> anthropic.AsyncAnthropic:
+    """Get or create the AsyncAnthropic client for *api_key* on the running loop."""
+    loop = asyncio.get_running_loop()
+    clients = _shared_async_clients.get(loop, {})
+    client = clients.get(api_key)
+    if client is not None:
+        return client
+    with _shared_clients_lock:
+        for closed_loop in [l for l in _shared_async_clients if l.is_closed()]:
+            del _shared_async_clients[closed_loop]
+        clients = _shared_async_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                timeout=_HTTP_TIMEOUT,
+                max_retries=_MAX_RETRIES,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS
+                ),
+            )
+            clients[api_key] = client
+    return client
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object in *text*, or None.
+
+    One linear pass: braces are counted outside string literals only, and
+    backslash escapes inside strings are honoured. Leading prose or a
+    ```json fence is skipped simply by starting at the first '{'.
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped_until = -1
+    for match in _JSON_STRUCTURAL_RE.finditer(text, start):
+        pos = match.start()
+        if pos < escaped_until:
+            continue
+        char = match.group()
+        if in_string:
+            if char == '\\':
+                escaped_until = pos + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:pos + 1]
+    return None
+
+
+def _message_text(message: Any) -> str:
+    """Concatenate the text blocks of a Messages API response."""
+    return ''.join(block.text for block in message.content if block.type == 'text')
+
+
+def _env_float(name: str) -> Optional[float]:
+    """Read an optional positive number from the environment."""
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+# Values substituted for top-level fields missing from Claude's output
+_OUTPUT_DEFAULTS: Dict[str, Any] = {
+    'encounter_summary': {
+        'chief_complaint': 'N/A',
+        'history_of_present_illness': 'N/A',
+    },
+    'vital_signs_extracted': {
+        'blood_pressure': 'N/A',
+        'temperature': 'N/A',
+        'heart_rate': 'N/A',
+    },
+    'clinical_entities': {
+        'diagnoses_problems': [],
+        'medication_requests_new_or_changed': [],
+        'allergies': [],
+    },
+    'assessment_plan_draft': 'N/A',
+    'ai_confidence_score': 50,
+    'flagged_for_review': False,
+}
+
+
+# Arrays clinical_entities must contain, in the order errors are reported
+_ENTITY_LIST_FIELDS = tuple(_OUTPUT_DEFAULTS['clinical_entities'])
+
+# Every top-level field, for the complete-response fast path
+_OUTPUT_FIELDS = frozenset(_OUTPUT_DEFAULTS)
+
+
+def _fresh_default(value: Any) -> Any:
+    """Copy a value from _OUTPUT_DEFAULTS so outputs never share its dicts or lists."""
+    if isinstance(value, dict):
+        return {key: _fresh_default(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class ClaudeCircuitOpenError(RuntimeError):
+    """Raised without calling Claude while the circuit breaker is open."""
+
+
+def _is_outage(exc: Exception) -> bool:
+    """True for errors that mean the API is unreachable or failing (5xx)."""
+    return isinstance(exc, anthropic.APIConnectionError) or (
+        isinstance(exc, anthropic.APIStatusError) and exc.status_code >= 500
+    )
+
+
+class _CircuitBreaker:
+    """
+    Fails fast after repeated outages instead of queueing more doomed calls.
+
+    Opens after *threshold* consecutive outage errors (each already retried
+    by the SDK) and rejects calls for *cooldown* seconds. After that a single
+    probe call goes through while the rest keep being rejected; its outcome
+    closes the circuit or reopens it for another cooldown.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> bool:
+        """Admit or reject a call; returns True if it is the half-open probe."""
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if remaining <= 0 and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            if self._probe_in_flight:
+                raise ClaudeCircuitOpenError(
+                    f'Claude API circuit open after {self._failures} consecutive '
+                    f'failures; probe call in progress'
+                )
+            raise ClaudeCircuitOpenError(
+                f'Claude API circuit open after {self._failures} consecutive '
+                f'failures; retry in {remaining:.0f}s'
+            )
+
+    def record(self, exc: Optional[Exception] = None, probe: bool = False) -> None:
+        """Record a call outcome; anything but an outage closes the circuit."""
+        with self._lock:
+            if probe:
+                self._probe_in_flight = False
+            if exc is None or not _is_outage(exc):
+                self._failures = 0
+                if probe:
+                    self._opened_at = None
+                return
+            self._failures += 1
+            if probe or (self._failures >= self.threshold and self._opened_at is None):
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    'Claude API circuit opened after %d consecutive failures', self._failures
+                )
+
+    def release_probe(self) -> None:
+        """Let another call probe when the probe ended without an API outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class _OutputTokenEstimator:
+    """
+    Rolling p95 of output tokens per input character.
+
+    Used to reserve a realistic token budget per request in the client-side
+    rate limiter instead of the full max_tokens, which for a typical note
+    is several times what Claude actually generates. Until enough calls
+    have been observed the estimate is max_tokens itself.
+    """
+
+    WINDOW = 512
+    MIN_SAMPLES = 20
+    RECOMPUTE_EVERY = 16
+    MARGIN = 1.25
+
+    def __init__(self):
+        self._ratios: Deque[float] = deque(maxlen=self.WINDOW)
+        self._observed = 0
+        self._p95: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def observe(self, input_chars: int, output_tokens: Optional[int]) -> None:
+        """Record the output size of a completed call."""
+        if input_chars <= 0 or not output_tokens:
+            return
+        with self._lock:
+            self._ratios.append(output_tokens / input_chars)
+            self._observed += 1
+            if self._observed >= self.MIN_SAMPLES and self._observed % self.RECOMPUTE_EVERY == 0:
+                ordered = sorted(self._ratios)
+                self._p95 = ordered[int(0.95 * (len(ordered) - 1))]
+
+    def estimate(self, input_chars: int, max_tokens: int) -> int:
+        """Predicted p95 output tokens for an input, capped at *max_tokens*."""
+        if self._p95 is None:
+            return max_tokens
+        return max(1, min(max_tokens, int(self._p95 * input_chars * self.MARGIN) + 64))
+
+
+class _AsyncRateLimiter:
+    """
+    Request and token buckets for one event loop, refilled continuously on
+    a monotonic clock from per-minute limits.
+
+    Callers wait *before* sending rather than after a 429, so no request is
+    wasted on a rate-limit rejection. A limit of None is unbounded.
+    """
+
+    def __init__(self, rpm: Optional[float], tpm: Optional[float]):
+        self.rpm = float(rpm) if rpm else math.inf
+        self.tpm = float(tpm) if tpm else math.inf
+        self.available_request_capacity = self.rpm
+        self.available_token_capacity = self.tpm
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and *tokens* tokens are available, then take them."""
+        # A single request larger than the whole bucket would otherwise never fit
+        tokens = min(tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                await asyncio.sleep(self._wait_seconds(tokens))
+
+    def _wait_seconds(self, tokens: float) -> float:
+        """Time until the finite buckets hold one request and *tokens* tokens."""
+        # An unbounded limit contributes no wait; inf / inf would be nan, and
+        # asyncio.sleep(nan) never returns.
+        wait = 0.0
+        if math.isfinite(self.rpm):
+            wait = max(wait, (1 - self.available_request_capacity) * 60 / self.rpm)
+        if math.isfinite(self.tpm):
+            wait = max(wait, (tokens - self.available_token_capacity) * 60 / self.tpm)
+        return wait
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Lower the buckets to the remaining capacity the API reports."""
+        for header, attr in (
+            ('anthropic-ratelimit-requests-remaining', 'available_request_capacity'),
+            ('anthropic-ratelimit-tokens-remaining', 'available_token_capacity'),
+        ):
+            try:
+                remaining = float(headers.get(header))
+            except (TypeError, ValueError):
+                continue
+            if remaining < getattr(self, attr):
+                setattr(self, attr, remaining)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.available_request_capacity = self._refilled(
+            self.available_request_capacity, self.rpm, elapsed
+        )
+        self.available_token_capacity = self._refilled(
+            self.available_token_capacity, self.tpm, elapsed
+        )
+
+    @staticmethod
+    def _refilled(available: float, limit: float, elapsed: float) -> float:
+        if not math.isfinite(limit):
+            return limit
+        return min(limit, available + elapsed * limit / 60)
+
+
+class _TopLevelFieldScanner:
+    """
+    Incrementally scans a streamed JSON object and reports each top-level
+    field as soon as its value is complete.
+
+    Only brace/bracket depth and string state are tracked, jumping straight
+    between structural characters; each finished value is decoded once with
+    orjson/json. Fields that fail to decode are skipped here and left to the
+    final full-response parse.
+    """
+
+    def __init__(self, on_field: Callable[[str, Any], None]):
+        self._on_field = on_field
+        self._text = ''
+        self._depth = 0
+        self._in_string = False
+        # Index of the first character not consumed by a backslash escape
+        self._skip_until = 0
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next text delta from the stream."""
+        if self._done:
+            return
+        pos = len(self._text)
+        self._text += chunk
+        text = self._text
+
+        for match in _JSON_FIELD_STRUCTURAL_RE.finditer(text, pos):
+            i = match.start()
+            if i < self._skip_until:
+                continue
+            ch = match.group()
+            if self._in_string:
+                if ch == '\\':
+                    self._skip_until = i + 2
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._value_start is None:
+                        self._key = text[self._key_start:i + 1]
+            elif self._depth == 0:
+                # Skip any preamble or code fence before the root object
+                if ch == '{':
+                    self._depth = 1
+            elif ch == '"':
+                self._in_string = True
+                if self._depth == 1 and self._value_start is None:
+                    self._key_start = i
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(i)
+                    self._done = True
+                    return
+                if self._depth == 1:
+                    self._emit(i + 1)
+            elif self._depth == 1:
+                if ch == ':':
+                    self._value_start = i + 1
+                elif ch == ',':
+                    self._emit(i)
+
+    def _emit(self, end: int) -> None:
+        if self._value_start is None or self._key is None:
+            return
+        value_text = self._text[self._value_start:end]
+        self._value_start = None
+        try:
+            key = _json_loads(self._key)
+            value = _json_loads(value_text)
+        except ValueError:
+            return
+        finally:
+            self._key = None
+        try:
+            self._on_field(key, value)
+        except Exception as exc:
+            # Consumers rebuild from the final parse; never abort the stream
+            logger.debug('Streamed field handler failed for %r: %s', key, exc)
+
+
+class _SQLiteResponseCache:
+    """
+    Persistent second tier of the response cache: response text keyed by
+    the same hash as the in-memory LRU, with a time-to-live.
+
+    The database only ever holds de-identified model output and is created
+    owner-only. Errors are logged and treated as a miss, so a broken cache
+    file never fails a Claude call.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    def get(self, key: bytes) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    'SELECT response FROM claude_responses WHERE hash = ? AND expires_at > ?',
+                    (key, int(time.time())),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning('Response cache read failed (%s): %s', self.path, exc)
+            return None
+        return row[0] if row else None
+
+    def set(self, key: bytes, response_text: str) -> None:
+        now = int(time.time())
+        try:
+            with self._lock:
+                self._connection().execute(
+                    'INSERT OR REPLACE INTO claude_responses VALUES (?, ?, ?, ?)',
+                    (key, response_text, now, now + int(self.ttl)),
+                )
+        except sqlite3.Error as exc:
+            logger.warning('Response cache write failed (%s): %s', self.path, exc)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (or, in a forked child, reopen) the database; caller holds the lock."""
+        if self._conn is None or self._pid != os.getpid():
+            os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS claude_responses ('
+                'hash BLOB PRIMARY KEY, response TEXT NOT NULL, '
+                'created_at INTEGER NOT NULL, expires_at INTEGER NOT NULL)'
+            )
+            conn.execute('DELETE FROM claude_responses WHERE expires_at <= ?', (int(time.time()),))
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+
 class ClaudeAPIWrapper:
     """
     Wrapper for Claude API calls with structured outputs.
@@ -40,11 +612,37 @@ class ClaudeAPIWrapper:
         if not self.api_key:
             raise ValueError('ANTHROPIC_API_KEY environment variable is not set')
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _get_shared_client(self.api_key)
+        # Optional per-wrapper override of the shared per-loop async client
+        self._async_client: Optional[anthropic.AsyncAnthropic] = None
         self.audit_logger = audit_logger
         self.model = os.getenv('CLAUDE_MODEL', 'claude-sonnet-4-5-20250929')
         self.temperature = 0  # Deterministic output for clinical work
 
+        # Optional account rate limits used to throttle process_batch_async
+        self.requests_per_minute = _env_float('CLAUDE_RPM')
+        self.tokens_per_minute = _env_float('CLAUDE_TPM')
+        self._output_estimator = _OutputTokenEstimator()
+        self._circuit = _CircuitBreaker(
+            int(os.getenv('CLAUDE_CIRCUIT_THRESHOLD', '5')),
+            _env_float('CLAUDE_CIRCUIT_COOLDOWN') or 30.0,
+        )
+
+        # LRU of raw responses keyed by a hash of (model, max_tokens, input).
+        # With temperature 0 a repeated input yields the same output, so
+        # retries and duplicate conversations skip the API round trip.
+        self._response_cache: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._response_cache_size = int(os.getenv('CLAUDE_RESPONSE_CACHE_SIZE', 256))
+        self._response_cache_lock = threading.Lock()
+        # Async requests currently in flight, by response-cache key
+        self._inflight: Dict[bytes, 'asyncio.Future[Optional[str]]'] = {}
+        # Optional on-disk tier, shared across processes and restarts
+        cache_db = os.getenv('CLAUDE_RESPONSE_CACHE_DB')
+        self._persistent_cache: Optional[_SQLiteResponseCache] = (
+            _SQLiteResponseCache(cache_db, _env_float('CLAUDE_RESPONSE_CACHE_TTL') or 7 * 86400)
+            if cache_db else None
+        )
+
     def set_model(self, model: str) -> None:
         """Override the model used for API calls."""
         self.model = model
@@ -58,7 +656,9 @@ class ClaudeAPIWrapper:
         masked_conversation: str,
         transaction_id: str,
         max_tokens: int = 2048,
-    ) -> Tuple[Dict[str, Any], str]:
+        on_field: Optional[Callable[[str, Any], None]] = None,
+        parsed_only: bool = False,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
         """
         Process a de-identified clinical conversation and extract structured data.
 
@@ -66,49 +666,587 @@ class ClaudeAPIWrapper:
             masked_conversation: The de-identified clinical conversation text.
             transaction_id: Unique transaction identifier for audit logging.
             max_tokens: Maximum tokens for the response.
+            on_field: Optional callback, called with (field, value) as each
+                top-level field of the streamed JSON object completes, before
+                the rest has been generated.
+            parsed_only: Return None in place of the raw text, so callers
+                that only need the dict do not keep it alive.
 
         Returns:
-            Tuple of (structured_output_dict, raw_response_text).
+            Tuple of (structured_output_dict, raw_response_text or None).
         """
-        system_prompt = self._get_system_prompt()
-        user_message = self._get_user_message(masked_conversation)
+        request, user_message = self._build_request(masked_conversation, max_tokens)
 
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[{'role': 'user', 'content': user_message}],
+        cache_key = self._response_cache_key(masked_conversation, max_tokens)
+        response_text = self._cached_response(cache_key)
+        if response_text is not None:
+            self._log_success(
+                transaction_id, len(user_message), len(response_text), max_tokens, 'cache_hit'
             )
+            return self._parse_json_response(response_text), None if parsed_only else response_text
+
+        try:
+            response_text, usage = self._stream_response(request, on_field)
 
-            response_text = response.content[0].text
             structured_output = self._parse_json_response(response_text)
+        except (json.JSONDecodeError, RuntimeError, anthropic.APIError) as exc:
+            self._raise_call_error(exc, transaction_id, len(user_message), max_tokens)
 
-            if self.audit_logger:
-                self.audit_logger.log_claude_api_call(
-                    transaction_id=transaction_id,
-                    prompt_length=len(user_message),
-                    response_length=len(response_text),
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    temperature=self.temperature,
-                    status='success',
+        self._output_estimator.observe(len(masked_conversation), usage.output_tokens)
+        self._store_response(cache_key, response_text)
+        self._log_success(
+            transaction_id, len(user_message), len(response_text), max_tokens,
+            cache_read_input_tokens=usage.cache_read_input_tokens,
+        )
+        return structured_output, None if parsed_only else response_text
+
+    async def process_clinical_conversation_async(
+        self,
+        masked_conversation: str,
+        transaction_id: str,
+        max_tokens: int = 2048,
+        on_field: Optional[Callable[[str, Any], None]] = None,
+        parsed_only: bool = False,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Async variant of process_clinical_conversation using AsyncAnthropic.
+
+        Audit logging only enqueues onto the AuditLogger's background
+        listener, so it is called inline without a worker-thread hop.
+
+        Returns:
+            Tuple of (structured_output_dict, raw_response_text or None).
+        """
+        return await self._process_async(
+            masked_conversation, transaction_id, max_tokens, on_field,
+            parsed_only=parsed_only,
+        )
+
+    async def _process_async(
+        self,
+        masked_conversation: str,
+        transaction_id: str,
+        max_tokens: int,
+        on_field: Optional[Callable[[str, Any], None]] = None,
+        rate_limiter: Optional[_AsyncRateLimiter] = None,
+        parsed_only: bool = False,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Body of process_clinical_conversation_async, optionally rate limited."""
+        request, user_message = self._build_request(masked_conversation, max_tokens)
+
+        cache_key = self._response_cache_key(masked_conversation, max_tokens)
+        response_text = self._cached_response(cache_key)
+        if response_text is not None:
+            self._log_success(
+                transaction_id, len(user_message), len(response_text), max_tokens, 'cache_hit'
+            )
+            return self._parse_json_response(response_text), None if parsed_only else response_text
+
+        # Coalesce with an identical request already in flight on this loop:
+        # wait for its response instead of sending a duplicate. If it fails,
+        # the first waiter to resume takes over and the rest wait on it.
+        loop = asyncio.get_running_loop()
+        leader = self._inflight.get(cache_key)
+        while leader is not None and leader.get_loop() is loop:
+            response_text = await asyncio.shield(leader)
+            if response_text is not None:
+                self._log_success(
+                    transaction_id, len(user_message), len(response_text), max_tokens, 'coalesced'
+                )
+                return (
+                    self._parse_json_response(response_text),
+                    None if parsed_only else response_text,
+                )
+            leader = self._inflight.get(cache_key)
+
+        inflight = loop.create_future()
+        self._inflight[cache_key] = inflight
+        try:
+            try:
+                if rate_limiter is not None:
+                    # Rough cost: ~4 characters per input token plus the
+                    # predicted output (never more than max_tokens)
+                    await rate_limiter.acquire(
+                        len(user_message) // 4
+                        + self._output_estimator.estimate(len(masked_conversation), max_tokens)
+                    )
+                response_text, usage = await self._stream_response_async(
+                    request, on_field, rate_limiter
                 )
 
-            return structured_output, response_text
+                structured_output = self._parse_json_response(response_text)
+            except (json.JSONDecodeError, RuntimeError, anthropic.APIError) as exc:
+                self._raise_call_error(exc, transaction_id, len(user_message), max_tokens)
 
+            self._output_estimator.observe(len(masked_conversation), usage.output_tokens)
+            self._store_response(cache_key, response_text)
+            inflight.set_result(response_text)
+        finally:
+            if self._inflight.get(cache_key) is inflight:
+                del self._inflight[cache_key]
+            if not inflight.done():
+                inflight.set_result(None)
+
+        self._log_success(
+            transaction_id, len(user_message), len(response_text), max_tokens,
+            cache_read_input_tokens=usage.cache_read_input_tokens,
+        )
+        return structured_output, None if parsed_only else response_text
+
+    async def process_batch_async(
+        self,
+        conversations: List[Tuple[str, str]],
+        concurrency: int = 8,
+        max_tokens: int = 2048,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        parsed_only: bool = False,
+    ) -> List[Any]:
+        """
+        Process many de-identified conversations concurrently.
+
+        At most *concurrency* requests are in flight at once, and requests
+        are held back client-side so the batch stays under *rpm* / *tpm*,
+        which are further lowered from the rate-limit headers the API
+        returns.
+
+        Args:
+            conversations: (masked_conversation, transaction_id) pairs.
+            concurrency: Maximum number of concurrent Claude calls.
+            max_tokens: Maximum tokens per response.
+            rpm: Requests per minute (defaults to CLAUDE_RPM; unset is unlimited).
+            tpm: Tokens per minute (defaults to CLAUDE_TPM; unset is unlimited).
+            parsed_only: Drop each raw text once parsed (None in its place),
+                so a large batch does not hold every response in memory.
+
+        Returns:
+            One (structured_output_dict, raw_response_text) tuple per input,
+            in input order; a failed call yields its exception instead, so
+            one failure does not cancel the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        rpm = rpm if rpm is not None else self.requests_per_minute
+        tpm = tpm if tpm is not None else self.tokens_per_minute
+        rate_limiter = _AsyncRateLimiter(rpm, tpm) if rpm or tpm else None
+
+        async def _one(masked_conversation: str, transaction_id: str):
+            async with semaphore:
+                return await self._process_async(
+                    masked_conversation, transaction_id, max_tokens,
+                    rate_limiter=rate_limiter, parsed_only=parsed_only,
+                )
+
+        return await asyncio.gather(
+            *(_one(conv, tid) for conv, tid in conversations),
+            return_exceptions=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Multiplexed requests (several conversations per call)
+    # ------------------------------------------------------------------
+
+    def process_clinical_conversations_multiplex(
+        self,
+        conversations: List[Tuple[str, str]],
+        k: int = 5,
+        max_tokens: int = 2048,
+    ) -> List[Any]:
+        """
+        Process conversations k at a time, one Claude request per group.
+
+        The system prompt is sent once per group instead of once per
+        conversation, cutting the request count roughly k-fold. Groups are
+        shrunk so the estimated input stays inside the context window and
+        k * max_tokens inside the output budget.
+
+        Args:
+            conversations: (masked_conversation, transaction_id) pairs.
+            k: Maximum conversations per request.
+            max_tokens: Output budget per conversation.
+
+        Returns:
+            One (structured_output_dict, raw_response_text) tuple per input,
+            in input order; a failed conversation yields a RuntimeError
+            instead.
+        """
+        k = max(1, min(k, _MULTIPLEX_MAX_OUTPUT_TOKENS // max_tokens))
+        results: List[Any] = [None] * len(conversations)
+
+        # Serve cached conversations first; pack the rest into groups
+        groups: List[List[Tuple[int, str, str, bytes]]] = []
+        group_tokens = 0
+        for index, (masked_conversation, transaction_id) in enumerate(conversations):
+            # A single-conversation reply may be served here, but multiplexed
+            # replies are only stored under the multiplex fingerprint
+            cache_key = self._response_cache_key(
+                masked_conversation, max_tokens, _MULTIPLEX_PROMPT_FINGERPRINT
+            )
+            response_text = (
+                self._cached_response(self._response_cache_key(masked_conversation, max_tokens))
+                or self._cached_response(cache_key)
+            )
+            if response_text is not None:
+                self._log_success(
+                    transaction_id, len(self._get_user_message(masked_conversation)),
+                    len(response_text), max_tokens, 'cache_hit',
+                )
+                results[index] = (self._parse_json_response(response_text), response_text)
+                continue
+
+            tokens = len(masked_conversation) // 4
+            if (not groups or len(groups[-1]) >= k
+                    or group_tokens + tokens > _MULTIPLEX_MAX_INPUT_TOKENS):
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append((index, masked_conversation, transaction_id, cache_key))
+            group_tokens += tokens
+
+        for group in groups:
+            self._process_multiplex_group(group, max_tokens, results)
+        return results
+
+    def _process_multiplex_group(
+        self,
+        group: List[Tuple[int, str, str, bytes]],
+        max_tokens: int,
+        results: List[Any],
+    ) -> None:
+        """Send one multiplexed request and fan its array out into *results*."""
+        blocks = [
+            f'CONVERSATION[{number}]:\n{masked_conversation}'
+            for number, (_, masked_conversation, _, _) in enumerate(group)
+        ]
+        user_message = _MULTIPLEX_PREFIX + '\n\n'.join(blocks) + _USER_MESSAGE_SUFFIX
+        request = dict(
+            model=self.model,
+            max_tokens=max_tokens * len(group),
+            temperature=self.temperature,
+            system=_SYSTEM_BLOCKS,
+            messages=[{'role': 'user', 'content': user_message}],
+        )
+
+        try:
+            response_text, _ = self._stream_response(request)
+            outputs = self._parse_json_array_response(response_text)
+        except (json.JSONDecodeError, RuntimeError, anthropic.APIError) as exc:
+            for index, _, transaction_id, _ in group:
+                try:
+                    self._raise_call_error(exc, transaction_id, len(user_message), max_tokens)
+                except RuntimeError as error:
+                    results[index] = error
+            return
+
+        by_number = {}
+        for output in outputs:
+            if not isinstance(output, dict):
+                continue
+            number = output.get('index')
+            # bool is an int subclass; true/false are not conversation numbers
+            if isinstance(number, int) and not isinstance(number, bool):
+                by_number[number] = {key: value for key, value in output.items() if key != 'index'}
+        for number, (index, _, transaction_id, cache_key) in enumerate(group):
+            prompt_length = len(blocks[number])
+            structured_output = by_number.get(number)
+            if structured_output is None:
+                error_msg = f'conversation {number} missing from multiplexed response'
+                logger.error('Claude multiplex failed for tx %s: %s', transaction_id, error_msg)
+                self._log_failure(transaction_id, prompt_length, max_tokens, error_msg)
+                results[index] = RuntimeError(f'Failed to parse Claude response: {error_msg}')
+                continue
+            item_text = _json_dumps(structured_output)
+            self._store_response(cache_key, item_text)
+            self._log_success(transaction_id, prompt_length, len(item_text), max_tokens)
+            results[index] = (structured_output, item_text)
+
+    # ------------------------------------------------------------------
+    # Message Batches (non-urgent bulk workloads)
+    # ------------------------------------------------------------------
+
+    def submit_batch(
+        self,
+        conversations: List[Tuple[str, str]],
+        max_tokens: int = 2048,
+    ) -> str:
+        """
+        Submit conversations as one Message Batch.
+
+        Each request's custom_id is its transaction id, which must be
+        unique within the batch.
+
+        Args:
+            conversations: (masked_conversation, transaction_id) pairs.
+            max_tokens: Maximum tokens per response.
+
+        Returns:
+            The batch id, for wait_for_batch / process_clinical_conversations_batch.
+        """
+        requests = []
+        for masked_conversation, transaction_id in conversations:
+            request, _ = self._build_request(masked_conversation, max_tokens)
+            requests.append({'custom_id': transaction_id, 'params': request})
+        return self._submit_batch_requests(requests)
+
+    def _submit_batch_requests(self, requests: List[Dict[str, Any]]) -> str:
+        """Create a Message Batch from prebuilt requests and return its id."""
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info('Submitted Claude message batch %s (%d requests)', batch.id, len(requests))
+        return batch.id
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Poll a Message Batch until processing has ended.
+
+        Raises:
+            TimeoutError: If *timeout* seconds pass before the batch ends.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == 'ended':
+                return batch
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f'Claude message batch {batch_id} did not finish in {timeout}s')
+            time.sleep(poll_interval)
+
+    def process_clinical_conversations_batch(
+        self,
+        conversations: List[Tuple[str, str]],
+        max_tokens: int = 2048,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
+        """
+        Process many conversations through the Message Batches API.
+
+        Batches are billed at half the price of regular calls but may take
+        up to 24 hours, so use this for overnight uploads rather than
+        interactive requests. Cached responses are served without being
+        submitted.
+
+        Args:
+            conversations: (masked_conversation, transaction_id) pairs.
+            max_tokens: Maximum tokens per response.
+            poll_interval: Seconds between batch status checks.
+            timeout: Give up waiting after this many seconds (None waits forever).
+
+        Returns:
+            One (structured_output_dict, raw_response_text) tuple per input,
+            in input order; a failed request yields a RuntimeError instead.
+        """
+        transaction_ids = [transaction_id for _, transaction_id in conversations]
+        if len(set(transaction_ids)) != len(transaction_ids):
+            raise ValueError('transaction ids must be unique within a batch')
+
+        results: List[Any] = [None] * len(conversations)
+        # transaction_id -> (index, cache_key, prompt_length)
+        pending: Dict[str, Tuple[int, bytes, int]] = {}
+        to_submit: List[Dict[str, Any]] = []
+
+        for index, (masked_conversation, transaction_id) in enumerate(conversations):
+            request, user_message = self._build_request(masked_conversation, max_tokens)
+            prompt_length = len(user_message)
+            cache_key = self._response_cache_key(masked_conversation, max_tokens)
+            response_text = self._cached_response(cache_key)
+            if response_text is not None:
+                self._log_success(
+                    transaction_id, prompt_length, len(response_text), max_tokens, 'cache_hit'
+                )
+                results[index] = (self._parse_json_response(response_text), response_text)
+                continue
+            pending[transaction_id] = (index, cache_key, prompt_length)
+            to_submit.append({'custom_id': transaction_id, 'params': request})
+
+        if not to_submit:
+            return results
+
+        batch_id = self._submit_batch_requests(to_submit)
+        self.wait_for_batch(batch_id, poll_interval, timeout)
+
+        for item in self.client.messages.batches.results(batch_id):
+            entry = pending.pop(item.custom_id, None)
+            if entry is None:
+                continue
+            index, cache_key, prompt_length = entry
+            results[index] = self._batch_item_result(
+                item, cache_key, prompt_length, max_tokens
+            )
+
+        for transaction_id, (index, _, prompt_length) in pending.items():
+            error_msg = f'no result returned for batch {batch_id}'
+            self._log_failure(transaction_id, prompt_length, max_tokens, error_msg)
+            results[index] = RuntimeError(f'Claude API call failed: {error_msg}')
+
+        return results
+
+    def _batch_item_result(
+        self,
+        item: Any,
+        cache_key: bytes,
+        prompt_length: int,
+        max_tokens: int,
+    ) -> Any:
+        """Turn one batch result line into an output tuple or a RuntimeError."""
+        transaction_id = item.custom_id
+        result = item.result
+        if result.type != 'succeeded':
+            error_msg = f'batch request {result.type}'
+            if result.type == 'errored':
+                error_msg += f': {result.error}'
+            logger.error('Claude batch request failed for tx %s: %s', transaction_id, error_msg)
+            self._log_failure(transaction_id, prompt_length, max_tokens, error_msg)
+            return RuntimeError(f'Claude API call failed: {error_msg}')
+
+        response_text = _message_text(result.message)
+        try:
+            structured_output = self._parse_json_response(response_text)
         except (json.JSONDecodeError, RuntimeError) as exc:
-            error_msg = f'JSON parsing error: {exc}'
-            logger.error('Failed to parse Claude response for tx %s: %s', transaction_id, exc)
-            self._log_failure(transaction_id, len(user_message), max_tokens, error_msg)
-            raise RuntimeError(f'Failed to parse Claude response: {error_msg}') from exc
+            try:
+                self._raise_call_error(exc, transaction_id, prompt_length, max_tokens)
+            except RuntimeError as error:
+                return error
+
+        self._store_response(cache_key, response_text)
+        self._log_success(
+            transaction_id, prompt_length, len(response_text), max_tokens,
+            cache_read_input_tokens=result.message.usage.cache_read_input_tokens,
+        )
+        return structured_output, response_text
+
+    @property
+    def async_client(self) -> anthropic.AsyncAnthropic:
+        """
+        AsyncAnthropic client shared by every wrapper on the running event loop.
+
+        Must be accessed from inside a coroutine.
+        """
+        if self._async_client is not None:
+            return self._async_client
+        return _get_shared_async_client(self.api_key)
+
+    def _build_request(
+        self, masked_conversation: str, max_tokens: int
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build Messages API request parameters; returns (request, user_message)."""
+        user_message = self._get_user_message(masked_conversation)
+        request = dict(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+            system=_SYSTEM_BLOCKS,
+            messages=[{'role': 'user', 'content': user_message}],
+        )
+        return request, user_message
+
+    def _response_cache_key(
+        self,
+        masked_conversation: str,
+        max_tokens: int,
+        prompt_fingerprint: bytes = _PROMPT_FINGERPRINT,
+    ) -> bytes:
+        """Hash everything that determines the response for the response cache."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(prompt_fingerprint)
+        digest.update(f'{self.model}|{max_tokens}|'.encode())
+        digest.update(masked_conversation.encode('utf-8', 'surrogatepass'))
+        return digest.digest()
+
+    def _cached_response(self, key: bytes) -> Optional[str]:
+        """
+        Return the cached response text for *key*, marking it recently used.
+
+        Falls back to the persistent cache, promoting a hit into memory.
+        """
+        with self._response_cache_lock:
+            response_text = self._response_cache.get(key)
+            if response_text is not None:
+                self._response_cache.move_to_end(key)
+                return response_text
+
+        if self._persistent_cache is not None:
+            response_text = self._persistent_cache.get(key)
+            if response_text is not None:
+                self._remember_response(key, response_text)
+        return response_text
+
+    def _store_response(self, key: bytes, response_text: str) -> None:
+        """Cache a successfully parsed response in every tier."""
+        self._remember_response(key, response_text)
+        if self._persistent_cache is not None:
+            self._persistent_cache.set(key, response_text)
+
+    def _remember_response(self, key: bytes, response_text: str) -> None:
+        """Add to the in-memory LRU, evicting the least recently used."""
+        if self._response_cache_size <= 0:
+            return
+        with self._response_cache_lock:
+            self._response_cache[key] = response_text
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
+    def _stream_response(
+        self,
+        request: Dict[str, Any],
+        on_field: Optional[Callable[[str, Any], None]] = None,
+    ) -> Tuple[str, Any]:
+        """
+        Stream a Messages request and return (full_text, usage).
 
+        Responses are always streamed, so the reply is assembled as tokens
+        arrive and parsing starts the moment the last delta lands. The SDK's
+        final message is the only copy of the text that is kept. When
+        *on_field* is given, completed top-level fields are also reported
+        while the rest is still being generated.
+        """
+        probe = self._circuit.before_call()
+        try:
+            with self.client.messages.stream(**request) as stream:
+                if on_field is not None:
+                    scanner = _TopLevelFieldScanner(on_field)
+                    for text_delta in stream.text_stream:
+                        scanner.feed(text_delta)
+                message = stream.get_final_message()
         except anthropic.APIError as exc:
-            error_msg = f'API error: {exc}'
-            logger.error('Claude API error for tx %s: %s', transaction_id, exc)
-            self._log_failure(transaction_id, len(user_message), max_tokens, error_msg)
-            raise RuntimeError(f'Claude API call failed: {error_msg}') from exc
+            self._circuit.record(exc, probe)
+            raise
+        except BaseException:
+            if probe:
+                self._circuit.release_probe()
+            raise
+        self._circuit.record(probe=probe)
+        return _message_text(message), message.usage
+
+    async def _stream_response_async(
+        self,
+        request: Dict[str, Any],
+        on_field: Optional[Callable[[str, Any], None]] = None,
+        rate_limiter: Optional[_AsyncRateLimiter] = None,
+    ) -> Tuple[str, Any]:
+        """Async counterpart of _stream_response."""
+        probe = self._circuit.before_call()
+        try:
+            async with self.async_client.messages.stream(**request) as stream:
+                if rate_limiter is not None:
+                    rate_limiter.update_from_headers(stream.response.headers)
+                if on_field is not None:
+                    scanner = _TopLevelFieldScanner(on_field)
+                    async for text_delta in stream.text_stream:
+                        scanner.feed(text_delta)
+                message = await stream.get_final_message()
+        except anthropic.APIError as exc:
+            self._circuit.record(exc, probe)
+            raise
+        except BaseException:
+            if probe:
+                self._circuit.release_probe()
+            raise
+        self._circuit.record(probe=probe)
+        return _message_text(message), message.usage
 
     # ------------------------------------------------------------------
     # Schema validation
@@ -121,99 +1259,67 @@ class ClaudeAPIWrapper:
         Validate that the Claude output matches the expected schema.
         Adds default values for missing fields to ensure robustness.
 
+        fastjsonschema is not used here: the full CLINICAL_NOTE_SCHEMA (item
+        enums, nested required fields) is stricter than what the pipeline
+        accepts, and it stops at the first error where the retry prompt
+        needs every one.
+
         Args:
             output: The parsed JSON output from Claude.
 
         Returns:
             Tuple of (is_valid, error_messages).
         """
-        required_fields = {
-            'encounter_summary': {
-                'chief_complaint': 'N/A',
-                'history_of_present_illness': 'N/A',
-            },
-            'vital_signs_extracted': {
-                'blood_pressure': 'N/A',
-                'temperature': 'N/A',
-                'heart_rate': 'N/A',
-            },
-            'clinical_entities': {
-                'diagnoses_problems': [],
-                'medication_requests_new_or_changed': [],
-                'allergies': [],
-            },
-            'assessment_plan_draft': 'N/A',
-            'ai_confidence_score': 50,
-            'flagged_for_review': False,
-        }
-
         errors: list = []
         warnings: list = []
 
-        # Fill missing top-level fields with defaults
-        for field, default_value in required_fields.items():
-            if field not in output:
-                output[field] = default_value
-                warnings.append(f"Missing field '{field}': using default value")
+        # Fill missing top-level fields with (copies of) the defaults. A field
+        # filled here is valid by construction, so its checks are skipped.
+        if _OUTPUT_FIELDS <= output.keys():
+            missing: list = []
+        else:
+            missing = [field for field in _OUTPUT_DEFAULTS if field not in output]
+        for field in missing:
+            output[field] = _fresh_default(_OUTPUT_DEFAULTS[field])
+            warnings.append(f"Missing field '{field}': using default value")
 
         # Validate nested structures
-        summary = output.get('encounter_summary')
-        if not isinstance(summary, dict):
-            errors.append('encounter_summary must be an object')
-        elif 'chief_complaint' not in summary or 'history_of_present_illness' not in summary:
-            errors.append('encounter_summary missing required subfields')
-
-        entities = output.get('clinical_entities')
-        if not isinstance(entities, dict):
-            errors.append('clinical_entities must be an object')
-        else:
-            for list_field in (
-                'diagnoses_problems',
-                'medication_requests_new_or_changed',
-                'allergies',
-            ):
-                if not isinstance(entities.get(list_field), list):
-                    errors.append(f'{list_field} must be an array')
-
-        score = output.get('ai_confidence_score')
-        if not isinstance(score, (int, float)) or not (1 <= score <= 100):
-            errors.append('ai_confidence_score must be a number between 1 and 100')
-
-        if not isinstance(output.get('flagged_for_review'), bool):
+        if 'encounter_summary' not in missing:
+            summary = output['encounter_summary']
+            if not isinstance(summary, dict):
+                errors.append('encounter_summary must be an object')
+            elif 'chief_complaint' not in summary or 'history_of_present_illness' not in summary:
+                errors.append('encounter_summary missing required subfields')
+
+        if 'clinical_entities' not in missing:
+            entities = output['clinical_entities']
+            if not isinstance(entities, dict):
+                errors.append('clinical_entities must be an object')
+            else:
+                for list_field in _ENTITY_LIST_FIELDS:
+                    if not isinstance(entities.get(list_field), list):
+                        errors.append(f'{list_field} must be an array')
+
+        if 'ai_confidence_score' not in missing:
+            score = output['ai_confidence_score']
+            if (not isinstance(score, (int, float)) or isinstance(score, bool)
+                    or not (1 <= score <= 100)):
+                errors.append('ai_confidence_score must be a number between 1 and 100')
+
+        if not isinstance(output['flagged_for_review'], bool):
             output['flagged_for_review'] = False
 
-        is_valid = len(errors) == 0
-        return is_valid, errors + warnings
+        return not errors, errors + warnings
 
     # ------------------------------------------------------------------
     # Prompt builders
     # ------------------------------------------------------------------
 
     def _get_system_prompt(self) -> str:
-        return (
-            'Extract clinical data from de-identified conversation. '
-            'Output MUST be valid JSON.\n\n'
-            'Rules:\n'
-            '- NEVER include patient names, dates, or identifiers\n'
-            '- Only extract explicitly stated facts\n'
-            "- Use 'N/A' for missing fields\n"
-            '- Return a JSON object with: encounter_summary, vital_signs_extracted, '
-            'clinical_entities, assessment_plan_draft, ai_confidence_score, flagged_for_review'
-        )
+        return _SYSTEM_PROMPT
 
     def _get_user_message(self, masked_conversation: str) -> str:
-        return (
-            'Extract JSON from this clinical conversation (de-identified):\n\n'
-            f'{masked_conversation}\n\n'
-            'Return JSON with:\n'
-            '- encounter_summary: {chief_complaint, history_of_present_illness}\n'
-            '- vital_signs_extracted: {blood_pressure, temperature, heart_rate}\n'
-            '- clinical_entities: {diagnoses_problems[], medication_requests_new_or_changed[], allergies[]}\n'
-            '- assessment_plan_draft: string\n'
-            '- ai_confidence_score: 1-100\n'
-            '- flagged_for_review: boolean\n\n'
-            'Only extract stated facts.'
-        )
+        return _USER_MESSAGE_PREFIX + masked_conversation + _USER_MESSAGE_SUFFIX
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -234,34 +1340,36 @@ class ClaudeAPIWrapper:
             RuntimeError: If all parsing strategies fail.
         """
         json_text = response_text.strip()
-
-        # Strip markdown code fences if present
-        if '```json' in json_text:
-            json_text = json_text.split('```json')[1].split('```')[0].strip()
-        elif '```' in json_text:
-            json_text = json_text.split('```')[1].split('```')[0].strip()
-
         last_error: Optional[Exception] = None
 
-        # Strategy 1: direct parse
+        # Strategy 1: direct parse (the common case for structured output)
         try:
-            return json.loads(json_text)
+            return _json_loads(json_text)
         except json.JSONDecodeError as exc:
             last_error = exc
 
-        # Strategy 2: extract first {...} block
-        start = json_text.find('{')
-        end = json_text.rfind('}')
-        if start != -1 and end != -1 and end > start:
+        # Strategy 2: first balanced {...} object, wherever it sits. The
+        # usual case is a fence or prose around a single object, so first
+        # try the span from the first '{' to the last '}' (two C-level
+        # scans); if that parses it is exactly the balanced object
+        start, end = json_text.find('{'), json_text.rfind('}')
+        if 0 <= start < end:
+            try:
+                return _json_loads(json_text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+        extracted = _extract_json_object(json_text)
+        if extracted is not None:
+            json_text = extracted
             try:
-                return json.loads(json_text[start: end + 1])
+                return _json_loads(json_text)
             except json.JSONDecodeError as exc:
                 last_error = exc
 
-        # Strategy 3: escape bare newlines / carriage returns
+        # Strategy 3: escape bare newlines / carriage returns in that slice
         try:
             fixed = json_text.replace('\n', '\\n').replace('\r', '\\r')
-            return json.loads(fixed)
+            return _json_loads(fixed)
         except json.JSONDecodeError as exc:
             last_error = exc
 
@@ -269,6 +1377,84 @@ class ClaudeAPIWrapper:
             f'Could not parse Claude response as JSON: {last_error}'
         )
 
+    @staticmethod
+    def _parse_json_array_response(response_text: str) -> List[Any]:
+        """
+        Parse the JSON array returned for a multiplexed request.
+
+        Raises:
+            RuntimeError: If no JSON array can be parsed.
+        """
+        json_text = response_text.strip()
+        # A fence, when present, opens the reply: strip it by offset and
+        # one rfind, leaving the regex below for anything less regular
+        if json_text.startswith('```'):
+            body = json_text[7:] if json_text.startswith('```json') else json_text[3:]
+            end = body.rfind('```')
+            try:
+                outputs = _json_loads(body[:end] if end != -1 else body)
+            except json.JSONDecodeError:
+                outputs = None
+            if isinstance(outputs, list):
+                return outputs
+
+        try:
+            outputs = _json_loads(json_text)
+        except json.JSONDecodeError as exc:
+            match = _JSON_ARRAY_RE.search(json_text)
+            if not match:
+                raise RuntimeError(f'Could not parse Claude response as JSON: {exc}') from exc
+            outputs = _json_loads(match.group(1) or match.group(2))
+
+        if not isinstance(outputs, list):
+            raise RuntimeError('Claude response is not a JSON array')
+        return outputs
+
+    def _raise_call_error(
+        self,
+        exc: Exception,
+        transaction_id: str,
+        prompt_length: int,
+        max_tokens: int,
+    ) -> None:
+        """Audit-log a failed Claude call and re-raise it as RuntimeError."""
+        if isinstance(exc, ClaudeCircuitOpenError):
+            logger.warning('Claude call skipped for tx %s: %s', transaction_id, exc)
+            self._log_failure(transaction_id, prompt_length, max_tokens, str(exc))
+            raise exc
+
+        if isinstance(exc, anthropic.APIError):
+            error_msg = f'API error: {exc}'
+            logger.error('Claude API error for tx %s: %s', transaction_id, exc)
+            self._log_failure(transaction_id, prompt_length, max_tokens, error_msg)
+            raise RuntimeError(f'Claude API call failed: {error_msg}') from exc
+
+        error_msg = f'JSON parsing error: {exc}'
+        logger.error('Failed to parse Claude response for tx %s: %s', transaction_id, exc)
+        self._log_failure(transaction_id, prompt_length, max_tokens, error_msg)
+        raise RuntimeError(f'Failed to parse Claude response: {error_msg}') from exc
+
+    def _log_success(
+        self,
+        transaction_id: str,
+        prompt_length: int,
+        response_length: int,
+        max_tokens: int,
+        status: str = 'success',
+        cache_read_input_tokens: Optional[int] = None,
+    ) -> None:
+        if self.audit_logger:
+            self.audit_logger.log_claude_api_call(
+                transaction_id=transaction_id,
+                prompt_length=prompt_length,
+                response_length=response_length,
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=self.temperature,
+                status=status,
+                cache_read_input_tokens=cache_read_input_tokens,
+            )
+
     def _log_failure(
         self,
         transaction_id: str,
@@ -3,10 +3,22 @@ De-identification Module for HIPAA Compliance
 Masks Protected Health Information (PHI) before data is sent to LLM
 """
 
+import atexit
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import AnyStr, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
+# Hyperscan is optional; without it every PHI pattern is always run
+try:
+    import hyperscan
+    _HYPERSCAN_AVAILABLE = True
+except ImportError:
+    _HYPERSCAN_AVAILABLE = False
+
 
 class PHIRedactionList:
     """Defines all PHI categories to be redacted."""
@@ -58,20 +70,144 @@ class PHIRedactionList:
     }
 
 
+# Compiled once per process and shared by every DeIdentifier instance, so
+# repeated create_deidentifier() calls never pay the re.compile cost again
+_COMPILED_PHI_PATTERNS: Dict[str, re.Pattern] = {
+    phi_type: re.compile(pattern, re.IGNORECASE)
+    for phi_type, pattern in PHIRedactionList.PHI_CATEGORIES.items()
+}
+
+_COMPILED_TITLE_NAME_PATTERNS: Tuple[re.Pattern, ...] = tuple(
+    re.compile(p, re.IGNORECASE) for p in PHIRedactionList.TITLE_NAME_PATTERNS
+)
+
+# bytes twins of the patterns above, used for ASCII notes: bytes patterns
+# skip the Unicode case-folding work of str patterns and, on ASCII input,
+# match exactly the same spans, except that bytes \s omits \x1c-\x1f
+_COMPILED_ASCII_PHI_PATTERNS: Dict[str, re.Pattern] = {
+    phi_type: re.compile(pattern.encode('ascii'), re.IGNORECASE)
+    for phi_type, pattern in PHIRedactionList.PHI_CATEGORIES.items()
+}
+
+_COMPILED_ASCII_TITLE_NAME_PATTERNS: Tuple[re.Pattern, ...] = tuple(
+    re.compile(p.encode('ascii'), re.IGNORECASE) for p in PHIRedactionList.TITLE_NAME_PATTERNS
+)
+
+# Characters str \s matches in the ASCII range but bytes \s does not
+_STR_ONLY_WHITESPACE = re.compile('[\x1c-\x1f]')
+
+# Post-redaction residual PHI checks used by validate_deidentification.
+# Each pattern starts with its first character class and checks the
+# leading word boundary with a lookbehind after it (e.g. (?<!\w\d) in
+# place of \b\d), which matches exactly the same spans but lets re use its
+# fast first-character search instead of trying every position.
+_VALIDATION_CHECKS: Dict[str, re.Pattern] = {
+    # \b[A-Z][a-z]+ [A-Z][a-z]+\b
+    'potential_names': re.compile(r'[A-Z](?<!\w[A-Z])[a-z]+ [A-Z][a-z]+\b'),
+    # \b\d{1,2}/\d{1,2}/\d{4}\b
+    'potential_dates': re.compile(r'\d(?<!\w\d)\d?/\d{1,2}/\d{4}\b'),
+    # (?<!\[)\b\d{6,10}\b(?!\]): long digit sequences that are NOT inside a
+    # placeholder bracket
+    'potential_numbers': re.compile(r'\d(?<![\[\w]\d)\d{5,9}\b(?!\])'),
+}
+
+
+def _build_hyperscan_prefilter():
+    """
+    Compile every PHI category and title-name pattern into one Hyperscan
+    database used as a prefilter.
+
+    The database only decides *which* patterns can possibly match; the
+    actual redaction is still done by the Python patterns above, so output
+    is identical with or without Hyperscan. To guarantee no false negatives:
+
+    - patterns are compiled with HS_FLAG_PREFILTER (may over-report only)
+    - ``\\b`` assertions are stripped, since earlier redactions can create
+      a word boundary next to a placeholder that was absent in the raw text
+
+    Returns:
+        Tuple of (database, keys by id), or None if unavailable. Keys are
+        PHI category names and compiled title-name patterns.
+    """
+    if not _HYPERSCAN_AVAILABLE:
+        return None
+
+    keys = tuple(PHIRedactionList.PHI_CATEGORIES) + _COMPILED_TITLE_NAME_PATTERNS
+    patterns = (
+        list(PHIRedactionList.PHI_CATEGORIES.values())
+        + PHIRedactionList.TITLE_NAME_PATTERNS
+    )
+    expressions = [p.replace(r'\b', '').encode('ascii') for p in patterns]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=(
+                hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_SINGLEMATCH
+                | hyperscan.HS_FLAG_PREFILTER
+            ),
+        )
+    except hyperscan.error:
+        return None
+    return database, keys
+
+
+_HYPERSCAN_PREFILTER = _build_hyperscan_prefilter()
+
+# Python's \s also matches these ASCII control characters; Hyperscan's does
+# not, so they are folded to a plain space before prefilter scanning
+_PREFILTER_WHITESPACE = str.maketrans({c: ' ' for c in '\x0b\x1c\x1d\x1e\x1f'})
+
+
+# Character classes each PHI category cannot match without. A single C-level
+# search for these is far cheaper than running the full pattern, and
+# redaction never creates new digits or '@', so a category whose required
+# class is absent from the raw text can be skipped outright.
+_PRESCAN_REQUIREMENTS: Dict[str, re.Pattern] = {
+    'dates': re.compile(r'\d'),
+    'mrn': re.compile(r'\d{6}'),
+    'ssn': re.compile(r'\d{3}'),
+    'phone': re.compile(r'\d{3}'),
+    'email': re.compile(r'@'),
+    'address_patterns': re.compile(r'\d'),
+    'age_specific': re.compile(r'\d'),
+}
+
+
+def _prescan_phi_types(text: str) -> FrozenSet:
+    """
+    Return the PHI categories whose required character classes occur in
+    *text*, plus every title-name pattern (which have no cheap prescan).
+    """
+    found: Dict[str, bool] = {}
+    candidates: List = list(_COMPILED_TITLE_NAME_PATTERNS)
+    for phi_type in PHIRedactionList.PHI_CATEGORIES:
+        requirement = _PRESCAN_REQUIREMENTS.get(phi_type)
+        if requirement is None:
+            candidates.append(phi_type)
+            continue
+        key = requirement.pattern
+        if key not in found:
+            found[key] = requirement.search(text) is not None
+        if found[key]:
+            candidates.append(phi_type)
+    return frozenset(candidates)
+
+
 class DeIdentifier:
     """Handles de-identification and PHI masking."""
 
     def __init__(self):
         self.redaction_list = PHIRedactionList()
-        # Pre-compile all patterns once at construction time
-        self._compiled: Dict[str, re.Pattern] = {
-            phi_type: re.compile(pattern, re.IGNORECASE)
-            for phi_type, pattern in self.redaction_list.PHI_CATEGORIES.items()
-        }
-        self._compiled_title_names: List[re.Pattern] = [
-            re.compile(p, re.IGNORECASE)
-            for p in self.redaction_list.TITLE_NAME_PATTERNS
-        ]
+        self._compiled = _COMPILED_PHI_PATTERNS
+        self._compiled_title_names = _COMPILED_TITLE_NAME_PATTERNS
+        self._compiled_ascii = _COMPILED_ASCII_PHI_PATTERNS
+        self._compiled_ascii_title_names = _COMPILED_ASCII_TITLE_NAME_PATTERNS
+        # Hyperscan scratch space is not thread-safe; keep one per thread
+        self._scratch = threading.local()
 
     # ------------------------------------------------------------------
     # Public API
@@ -92,29 +228,70 @@ class DeIdentifier:
         Returns:
             Tuple of (masked_text, redaction_audit)
         """
-        masked_text = raw_text
         audit: Dict = {
             'timestamp': datetime.now().isoformat(),
             'original_length': len(raw_text),
             'redactions_by_type': {},
         }
 
+        # Patterns the prefilter rules out are skipped in both passes
+        candidates = self._prefilter_phi_types(raw_text)
+
+        # ASCII notes are scanned as bytes with the bytes pattern twins
+        if raw_text.isascii() and _STR_ONLY_WHITESPACE.search(raw_text) is None:
+            masked_text = raw_text.encode('ascii')
+            compiled = self._compiled_ascii
+        else:
+            masked_text = raw_text
+            compiled = self._compiled
+
         # Pass 1 — title-based names (Dr./Mr./Ms./Mrs. + clinical context phrases)
-        masked_text, title_count = self._redact_title_names(masked_text)
+        masked_text, title_count = self._redact_title_names(masked_text, candidates)
         if title_count:
             audit['redactions_by_type']['title_names'] = title_count
 
         # Pass 2 — all PHI category patterns
-        for phi_type, compiled_pattern in self._compiled.items():
+        for phi_type, compiled_pattern in compiled.items():
+            if phi_type not in candidates:
+                continue
             placeholder = self.redaction_list.PLACEHOLDER_MAP[phi_type]
             masked_text, count = self._sub_count(compiled_pattern, placeholder, masked_text)
             if count > 0:
                 audit['redactions_by_type'][phi_type] = count
 
+        if isinstance(masked_text, bytes):
+            masked_text = masked_text.decode('ascii')
         audit['masked_length'] = len(masked_text)
         audit['total_redactions'] = sum(audit['redactions_by_type'].values())
         return masked_text, audit
 
+    def deidentify_batch(
+        self,
+        raw_texts: List[str],
+        chunksize: int = 16,
+    ) -> List[Tuple[str, Dict]]:
+        """
+        De-identify many notes, spread across worker processes.
+
+        Redaction is CPU-bound and holds the GIL, so threads cannot speed
+        it up. Workers come from one long-lived, spawned pool shared by the
+        process (see _get_batch_pool), each with its own DeIdentifier;
+        batches no larger than one chunk, or on a single CPU, are processed
+        in this process.
+
+        Args:
+            raw_texts: The raw clinical conversation texts.
+            chunksize: Notes sent to a worker at a time.
+
+        Returns:
+            List of (masked_text, redaction_audit), in input order.
+        """
+        if (os.cpu_count() or 1) <= 1 or len(raw_texts) <= chunksize:
+            return [self.deidentify(raw_text) for raw_text in raw_texts]
+
+        pool = _get_batch_pool()
+        return list(pool.map(_deidentify_in_worker, raw_texts, chunksize=chunksize))
+
     def validate_deidentification(self, masked_text: str) -> Dict:
         """
         Validate that no obvious PHI remains in the masked text.
@@ -127,14 +304,7 @@ class DeIdentifier:
             'remaining_phi_risks': [],
         }
 
-        checks = {
-            'potential_names': re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'),
-            'potential_dates': re.compile(r'\b\d{1,2}/\d{1,2}/\d{4}\b'),
-            # Long digit sequences that are NOT inside a placeholder bracket
-            'potential_numbers': re.compile(r'(?<!\[)\b\d{6,10}\b(?!\])'),
-        }
-
-        for check_type, pattern in checks.items():
+        for check_type, pattern in _VALIDATION_CHECKS.items():
             matches = pattern.findall(masked_text)
             if matches:
                 validation_report['is_safe'] = False
@@ -150,34 +320,101 @@ class DeIdentifier:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _redact_title_names(self, text: str) -> Tuple[str, int]:
-        """Apply title-name patterns and return (new_text, count)."""
+    def _prefilter_phi_types(self, text: str) -> FrozenSet:
+        """
+        Return the PHI categories and title-name patterns that may match *text*.
+
+        Uses a single Hyperscan scan when available. Otherwise, or when the
+        text is not ASCII (Python's Unicode-aware IGNORECASE and \\s
+        semantics are only mirrored for ASCII input), falls back to the
+        cheaper character-class prescan.
+        """
+        if _HYPERSCAN_PREFILTER is None or not text.isascii():
+            return _prescan_phi_types(text)
+
+        database, keys = _HYPERSCAN_PREFILTER
+        scratch = getattr(self._scratch, 'value', None)
+        if scratch is None:
+            scratch = self._scratch.value = hyperscan.Scratch(database)
+
+        hits = set()
+
+        def _on_match(pattern_id, _start, _end, _flags, _context):
+            hits.add(keys[pattern_id])
+
+        database.scan(
+            text.translate(_PREFILTER_WHITESPACE).encode('ascii'),
+            match_event_handler=_on_match,
+            scratch=scratch,
+        )
+        return frozenset(hits)
+
+    def _redact_title_names(self, text: AnyStr, candidates: FrozenSet) -> Tuple[AnyStr, int]:
+        """Apply the candidate title-name patterns and return (new_text, count)."""
+        compiled = (
+            self._compiled_ascii_title_names if isinstance(text, bytes)
+            else self._compiled_title_names
+        )
         total = 0
-        for pattern in self._compiled_title_names:
+        for key, pattern in zip(self._compiled_title_names, compiled):
+            if key not in candidates:
+                continue
             text, n = self._sub_count(pattern, '[PATIENT_NAME]', text)
             total += n
         return text, total
 
     @staticmethod
     def _sub_count(
-        pattern: re.Pattern, replacement: str, text: str
-    ) -> Tuple[str, int]:
+        pattern: re.Pattern, replacement: str, text: AnyStr
+    ) -> Tuple[AnyStr, int]:
         """
-        Apply *pattern* with re.sub and return (new_text, substitution_count).
+        Apply *pattern* with re.subn and return (new_text, substitution_count).
 
-        Key fix: re.sub processes all matches on the *original* string in a
+        Key fix: re.subn processes all matches on the *original* string in a
         single pass, so offsets are always correct — unlike the previous
-        approach of mutating the string inside a re.finditer loop.
+        approach of mutating the string inside a re.finditer loop. The
+        count comes back from C, with no Python callback per match
+        (placeholders contain no backslashes, so no template expansion).
         """
-        count = 0
+        if isinstance(text, bytes):
+            return pattern.subn(replacement.encode('ascii'), text)
+        return pattern.subn(replacement, text)
+
+
+# Per-process DeIdentifier for deidentify_batch worker processes
+_worker_deidentifier: Optional[DeIdentifier] = None
+
+# Worker pool for deidentify_batch, created on first use and kept for the
+# life of the process. Workers are spawned, not forked: the parent already
+# runs audit-listener, MongoDB and HTTP client threads.
+_batch_pool: Optional[ProcessPoolExecutor] = None
+_batch_pool_lock = threading.Lock()
+
+
+def _get_batch_pool() -> ProcessPoolExecutor:
+    """Get or create the shared deidentify_batch worker pool"""
+    global _batch_pool
+    if _batch_pool is None:
+        with _batch_pool_lock:
+            if _batch_pool is None:
+                _batch_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_deidentify_worker,
+                )
+                atexit.register(_batch_pool.shutdown)
+    return _batch_pool
+
+
+def _init_deidentify_worker():
+    """ProcessPoolExecutor initializer: build this worker's DeIdentifier"""
+    global _worker_deidentifier
+    _worker_deidentifier = DeIdentifier()
 
-        def _replacer(_match):
-            nonlocal count
-            count += 1
-            return replacement
 
-        new_text = pattern.sub(_replacer, text)
-        return new_text, count
+def _deidentify_in_worker(raw_text: str) -> Tuple[str, Dict]:
+    """Run deidentify inside a deidentify_batch worker process"""
+    return _worker_deidentifier.deidentify(raw_text)
 
 
 def create_deidentifier() -> DeIdentifier:
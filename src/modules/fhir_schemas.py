@@ -4,6 +4,13 @@ Defines the JSON schema structure for Claude API structured outputs
 and FHIR resource creation
 """
 
+# fastjsonschema is optional; without it bundles are checked field by field
+try:
+    import fastjsonschema
+    _FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    _FASTJSONSCHEMA_AVAILABLE = False
+
 # Clinical Note Schema - Output from Claude
 CLINICAL_NOTE_SCHEMA = {
     "name": "ClinicalNote",
@@ -415,6 +422,57 @@ FHIR_BUNDLE_SCHEMA = {
     }
 }
 
+# JSON Schema for the structural checks in FHIRTransformer.validate_fhir_bundle
+# (at least as strict, so a bundle that passes it also passes those checks)
+FHIR_BUNDLE_VALIDATION_SCHEMA = {
+    "type": "object",
+    "required": ["resourceType", "type", "entry"],
+    "properties": {
+        "resourceType": {"const": "Bundle"},
+        "type": {"const": "collection"},
+        "entry": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["resource"],
+                "properties": {
+                    "resource": {
+                        "type": "object",
+                        "required": ["resourceType", "id"],
+                        "properties": {
+                            "resourceType": {"type": "string", "minLength": 1}
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
+
+# Compiled once at import; None when fastjsonschema is not installed
+VALIDATE_BUNDLE = (
+    fastjsonschema.compile(FHIR_BUNDLE_VALIDATION_SCHEMA)
+    if _FASTJSONSCHEMA_AVAILABLE else None
+)
+
+
+def bundle_passes_schema(bundle) -> bool:
+    """
+    Check a bundle against the compiled validator
+
+    Returns:
+        True if it is accepted; False if it is rejected or fastjsonschema
+        is not installed (callers then run the detailed checks)
+    """
+    if VALIDATE_BUNDLE is None:
+        return False
+    try:
+        VALIDATE_BUNDLE(bundle)
+        return True
+    except fastjsonschema.JsonSchemaException:
+        return False
+
 # Terminology mapping for common conditions and medications
 CONDITION_CODE_MAP = {
     "high blood pressure": {"icd10": "I10", "snomed": "59621000"},
@@ -3,12 +3,15 @@ FHIR Transformation Module
 Converts Claude's structured output into FHIR R4 compliant resources
 """
 
-import json
 import uuid
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+
 from .fhir_schemas import (
     get_terminology_code,
+    bundle_passes_schema,
     FHIR_PATIENT_SCHEMA,
     FHIR_ENCOUNTER_SCHEMA,
     FHIR_CONDITION_SCHEMA,
@@ -16,6 +19,30 @@ from .fhir_schemas import (
 )
 from .audit_logger import AuditLogger
 
+# Map Claude diagnosis status to FHIR clinical status codes
+CONDITION_STATUS_CODES = {
+    'active': 'active',
+    'resolved': 'resolved',
+    'rule-out': 'unconfirmed',
+    'inactive': 'inactive'
+}
+
+# Map medication route to SNOMED CT (code, display)
+MEDICATION_ROUTE_CODES = {
+    'oral': ('386359008', 'Oral'),
+    'iv': ('47625008', 'Intravenous'),
+    'im': ('78421000', 'Intramuscular'),
+    'sc': ('34206005', 'Subcutaneous'),
+    'topical': ('404559004', 'Topical'),
+    'inhaled': ('404559004', 'Inhalation'),
+    'sublingually': ('37161004', 'Sublingual'),
+}
+
+
+def _fhir_timestamp() -> str:
+    """Current local time as a FHIR instant string"""
+    return datetime.now().isoformat() + "Z"
+
 
 class FHIRTransformer:
     """Transforms Claude's clinical output into FHIR R4 resources"""
@@ -36,6 +63,25 @@ class FHIRTransformer:
             'AllergyIntolerance': 0
         }
 
+    def create_bundle_builder(
+        self,
+        transaction_id: str,
+        patient_id: Optional[str] = None,
+        encounter_id: Optional[str] = None
+    ) -> 'FHIRBundleBuilder':
+        """
+        Start an incremental bundle for one transaction
+
+        Args:
+            transaction_id: Unique transaction identifier
+            patient_id: Optional patient ID (generates if not provided)
+            encounter_id: Optional encounter ID (generates if not provided)
+
+        Returns:
+            FHIRBundleBuilder that accepts Claude output fields as they arrive
+        """
+        return FHIRBundleBuilder(self, transaction_id, patient_id, encounter_id)
+
     def transform_to_fhir_bundle(
         self,
         claude_output: Dict[str, Any],
@@ -55,117 +101,101 @@ class FHIRTransformer:
         Returns:
             Tuple of (fhir_bundle, resource_counts)
         """
-        # Generate IDs if not provided
-        patient_id = patient_id or str(uuid.uuid4())
-        encounter_id = encounter_id or str(uuid.uuid4())
+        builder = self.create_bundle_builder(transaction_id, patient_id, encounter_id)
+        return builder.finalize(claude_output)
 
+    def _create_entity_entries(
+        self,
+        patient_id: str,
+        encounter_id: str,
+        entities: Any,
+        timestamp: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Create Condition, MedicationRequest and AllergyIntolerance entries"""
+        timestamp = timestamp or _fhir_timestamp()
         bundle_entries = []
+        resource_counts = {'Condition': 0, 'MedicationRequest': 0, 'AllergyIntolerance': 0}
+
+        # Ensure entities is a dict (handle case where Claude returns string)
+        if not isinstance(entities, dict):
+            entities = {}
+
+        # Process diagnoses
+        diagnoses = entities.get('diagnoses_problems', [])
+        if isinstance(diagnoses, str) or diagnoses is None:
+            diagnoses = []
+        for diagnosis in diagnoses:
+            condition_resource = self._create_condition_resource(
+                str(uuid.uuid4()),
+                patient_id,
+                encounter_id,
+                diagnosis,
+                timestamp
+            )
+            bundle_entries.append({
+                "fullUrl": f"urn:uuid:{condition_resource['id']}",
+                "resource": condition_resource
+            })
+            resource_counts['Condition'] += 1
+
+        # Create MedicationRequest Resources
+        medications = entities.get('medication_requests_new_or_changed', [])
+        if isinstance(medications, str) or medications is None:
+            medications = []
+        for medication in medications:
+            med_resource = self._create_medication_request_resource(
+                str(uuid.uuid4()),
+                patient_id,
+                encounter_id,
+                medication,
+                timestamp
+            )
+            bundle_entries.append({
+                "fullUrl": f"urn:uuid:{med_resource['id']}",
+                "resource": med_resource
+            })
+            resource_counts['MedicationRequest'] += 1
+
+        # Create AllergyIntolerance Resources
+        allergies = entities.get('allergies', [])
+        if isinstance(allergies, str) or allergies is None:
+            allergies = []
+        for allergy in allergies:
+            allergy_resource = self._create_allergy_resource(
+                str(uuid.uuid4()),
+                patient_id,
+                allergy
+            )
+            bundle_entries.append({
+                "fullUrl": f"urn:uuid:{allergy_resource['id']}",
+                "resource": allergy_resource
+            })
+            resource_counts['AllergyIntolerance'] += 1
 
-        # Create Patient Resource
-        patient_resource = self._create_patient_resource(patient_id)
-        bundle_entries.append({
-            "fullUrl": f"urn:uuid:{patient_id}",
-            "resource": patient_resource
-        })
-        self.resource_counter['Patient'] += 1
-
-        # Create Encounter Resource
-        encounter_resource = self._create_encounter_resource(
-            encounter_id,
-            patient_id,
-            claude_output
-        )
-        bundle_entries.append({
-            "fullUrl": f"urn:uuid:{encounter_id}",
-            "resource": encounter_resource
-        })
-        self.resource_counter['Encounter'] += 1
-
-        # Create Condition Resources
-        if 'clinical_entities' in claude_output:
-            entities = claude_output['clinical_entities']
-
-            # Ensure entities is a dict (handle case where Claude returns string)
-            if isinstance(entities, str):
-                entities = {}
-            if not isinstance(entities, dict):
-                entities = {}
-
-            # Process diagnoses
-            diagnoses = entities.get('diagnoses_problems', []) if isinstance(entities, dict) else []
-            if isinstance(diagnoses, str) or diagnoses is None:
-                diagnoses = []
-            for diagnosis in diagnoses:
-                condition_resource = self._create_condition_resource(
-                    str(uuid.uuid4()),
-                    patient_id,
-                    encounter_id,
-                    diagnosis
-                )
-                bundle_entries.append({
-                    "fullUrl": f"urn:uuid:{condition_resource['id']}",
-                    "resource": condition_resource
-                })
-                self.resource_counter['Condition'] += 1
-
-            # Create MedicationRequest Resources
-            medications = entities.get('medication_requests_new_or_changed', []) if isinstance(entities, dict) else []
-            if isinstance(medications, str) or medications is None:
-                medications = []
-            for medication in medications:
-                med_resource = self._create_medication_request_resource(
-                    str(uuid.uuid4()),
-                    patient_id,
-                    encounter_id,
-                    medication
-                )
-                bundle_entries.append({
-                    "fullUrl": f"urn:uuid:{med_resource['id']}",
-                    "resource": med_resource
-                })
-                self.resource_counter['MedicationRequest'] += 1
-
-            # Create AllergyIntolerance Resources
-            allergies = entities.get('allergies', []) if isinstance(entities, dict) else []
-            if isinstance(allergies, str) or allergies is None:
-                allergies = []
-            for allergy in allergies:
-                allergy_resource = self._create_allergy_resource(
-                    str(uuid.uuid4()),
-                    patient_id,
-                    allergy
-                )
-                bundle_entries.append({
-                    "fullUrl": f"urn:uuid:{allergy_resource['id']}",
-                    "resource": allergy_resource
-                })
-                self.resource_counter['AllergyIntolerance'] += 1
+        return bundle_entries, resource_counts
 
-        # Create the Bundle
-        fhir_bundle = {
-            "resourceType": "Bundle",
-            "id": str(uuid.uuid4()),
-            "type": "collection",
-            "timestamp": datetime.now().isoformat() + "Z",
-            "entry": bundle_entries,
-            "meta": {
-                "source": "clinical-scribe-ai",
-                "transactionId": transaction_id
-            }
-        }
+    def log_transformation(
+        self,
+        transaction_id: str,
+        claude_output: Dict[str, Any],
+        fhir_bundle: Dict[str, Any],
+        resource_counts: Dict[str, int]
+    ):
+        """
+        Record a completed transformation in the audit log
 
-        # Log transformation
+        Called by FHIRBundleBuilder.finalize once the bundle is assembled,
+        which covers both transform_to_fhir_bundle and streamed builds.
+        """
         if self.audit_logger:
             self.audit_logger.log_fhir_transformation(
                 transaction_id=transaction_id,
-                llm_output_length=len(json.dumps(claude_output)),
-                fhir_bundle_length=len(json.dumps(fhir_bundle)),
-                resources_created=dict(self.resource_counter),
+                llm_output_length=len(orjson.dumps(claude_output)),
+                fhir_bundle_length=len(orjson.dumps(fhir_bundle)),
+                resources_created=dict(resource_counts),
                 validation_passed=True
             )
 
-        return fhir_bundle, dict(self.resource_counter)
-
     def _create_patient_resource(self, patient_id: str) -> Dict[str, Any]:
         """Create a FHIR Patient resource"""
         return {
@@ -187,7 +217,8 @@ class FHIRTransformer:
         self,
         encounter_id: str,
         patient_id: str,
-        claude_output: Dict[str, Any]
+        claude_output: Dict[str, Any],
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a FHIR Encounter resource"""
         summary = claude_output.get('encounter_summary', {})
@@ -221,7 +252,7 @@ class FHIRTransformer:
                 "display": "[PATIENT_NAME]"
             },
             "period": {
-                "start": datetime.now().isoformat() + "Z"
+                "start": timestamp or _fhir_timestamp()
             },
             "reasonCode": [
                 {
@@ -244,7 +275,8 @@ class FHIRTransformer:
         condition_id: str,
         patient_id: str,
         encounter_id: str,
-        diagnosis: Dict[str, Any]
+        diagnosis: Dict[str, Any],
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a FHIR Condition resource"""
         # Handle both string and dict diagnoses
@@ -255,14 +287,7 @@ class FHIRTransformer:
             diagnosis_name = diagnosis.get('name', 'Unknown Condition')
             status = diagnosis.get('status', 'active').lower()
 
-        # Map status to FHIR clinical status codes
-        status_code_map = {
-            'active': 'active',
-            'resolved': 'resolved',
-            'rule-out': 'unconfirmed',
-            'inactive': 'inactive'
-        }
-        clinical_status = status_code_map.get(status, 'active')
+        clinical_status = CONDITION_STATUS_CODES.get(status, 'active')
 
         # Get terminology codes
         terminology = get_terminology_code(diagnosis_name, 'condition')
@@ -294,7 +319,7 @@ class FHIRTransformer:
             "encounter": {
                 "reference": f"Encounter/{encounter_id}"
             },
-            "recordedDate": datetime.now().isoformat() + "Z",
+            "recordedDate": timestamp or _fhir_timestamp(),
             "meta": {
                 "profile": ["http://hl7.org/fhir/StructureDefinition/Condition"]
             }
@@ -305,7 +330,8 @@ class FHIRTransformer:
         med_id: str,
         patient_id: str,
         encounter_id: str,
-        medication: Dict[str, Any]
+        medication: Dict[str, Any],
+        timestamp: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create a FHIR MedicationRequest resource"""
         # Handle both string and dict medications
@@ -324,17 +350,7 @@ class FHIRTransformer:
         terminology = get_terminology_code(med_name, 'medication')
 
         # Parse route to FHIR coding
-        route_code_map = {
-            'oral': ('386359008', 'Oral'),
-            'iv': ('47625008', 'Intravenous'),
-            'im': ('78421000', 'Intramuscular'),
-            'sc': ('34206005', 'Subcutaneous'),
-            'topical': ('404559004', 'Topical'),
-            'inhaled': ('404559004', 'Inhalation'),
-            'sublingually': ('37161004', 'Sublingual'),
-        }
-
-        route_code, route_display = route_code_map.get(route, ('404559004', route.capitalize()))
+        route_code, route_display = MEDICATION_ROUTE_CODES.get(route, ('404559004', route.capitalize()))
 
         return {
             "resourceType": "MedicationRequest",
@@ -357,7 +373,7 @@ class FHIRTransformer:
             "encounter": {
                 "reference": f"Encounter/{encounter_id}"
             },
-            "authoredOn": datetime.now().isoformat() + "Z",
+            "authoredOn": timestamp or _fhir_timestamp(),
             "dosageInstruction": [
                 {
                     "text": f"{dosage}",
@@ -455,6 +471,12 @@ class FHIRTransformer:
         Returns:
             Tuple of (is_valid, error_messages)
         """
+        # Fast path: the compiled validator accepts well-formed bundles
+        # without walking them in Python; failures fall through so the
+        # caller still gets the detailed messages below
+        if bundle_passes_schema(bundle):
+            return True, []
+
         errors = []
 
         # Check bundle structure
@@ -496,6 +518,117 @@ class FHIRTransformer:
         return len(errors) == 0, errors
 
 
+# Marks a Claude output field that is absent (distinct from a null value)
+_MISSING = object()
+
+
+class FHIRBundleBuilder:
+    """
+    Assembles a FHIR Bundle section by section
+
+    Sections are built from individual top-level Claude output fields via
+    add_field(), so resource construction can overlap with a streamed
+    response; finalize() rebuilds any section whose field never arrived or
+    differs in the final validated output, so the result always matches
+    transform_to_fhir_bundle() on the complete dict.
+    """
+
+    # Claude output fields that produce bundle entries, in bundle order
+    SECTION_FIELDS = ('encounter_summary', 'clinical_entities')
+
+    def __init__(
+        self,
+        transformer: FHIRTransformer,
+        transaction_id: str,
+        patient_id: Optional[str] = None,
+        encounter_id: Optional[str] = None
+    ):
+        self.transformer = transformer
+        self.transaction_id = transaction_id
+        self.patient_id = patient_id or str(uuid.uuid4())
+        self.encounter_id = encounter_id or str(uuid.uuid4())
+        # Every resource in the bundle shares one timestamp
+        self.timestamp = _fhir_timestamp()
+        # field -> (source value, entries, resource_counts)
+        self._sections: Dict[str, Tuple[Any, List[Dict[str, Any]], Dict[str, int]]] = {}
+
+    def add_field(self, field: str, value: Any):
+        """Build the resources for one top-level field of Claude's output"""
+        if field in self.SECTION_FIELDS:
+            self._sections[field] = (value, *self._build_section(field, value))
+
+    def finalize(self, claude_output: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        Assemble the bundle from the complete (validated) Claude output
+
+        Returns:
+            Tuple of (fhir_bundle, resource_counts)
+        """
+        transformer = self.transformer
+        resource_counts = dict.fromkeys(transformer.resource_counter, 0)
+
+        # Create Patient Resource
+        bundle_entries = [{
+            "fullUrl": f"urn:uuid:{self.patient_id}",
+            "resource": transformer._create_patient_resource(self.patient_id)
+        }]
+        resource_counts['Patient'] += 1
+
+        # Encounter, then Condition / MedicationRequest / AllergyIntolerance
+        for field in self.SECTION_FIELDS:
+            value = claude_output.get(field, _MISSING)
+            section = self._sections.get(field)
+            if section is None or section[0] != value:
+                section = (value, *self._build_section(field, value))
+            bundle_entries.extend(section[1])
+            for resource_type, count in section[2].items():
+                resource_counts[resource_type] += count
+
+        # Create the Bundle
+        fhir_bundle = {
+            "resourceType": "Bundle",
+            "id": str(uuid.uuid4()),
+            "type": "collection",
+            "timestamp": self.timestamp,
+            "entry": bundle_entries,
+            "meta": {
+                "source": "clinical-scribe-ai",
+                "transactionId": self.transaction_id
+            }
+        }
+
+        # Keep running totals across every bundle built by this transformer
+        for resource_type, count in resource_counts.items():
+            transformer.resource_counter[resource_type] += count
+
+        # Log transformation
+        transformer.log_transformation(self.transaction_id, claude_output, fhir_bundle, resource_counts)
+
+        return fhir_bundle, resource_counts
+
+    def _build_section(
+        self,
+        field: str,
+        value: Any
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """Create the bundle entries derived from one Claude output field"""
+        if field == 'encounter_summary':
+            encounter_resource = self.transformer._create_encounter_resource(
+                self.encounter_id,
+                self.patient_id,
+                {} if value is _MISSING else {field: value},
+                self.timestamp
+            )
+            entry = {"fullUrl": f"urn:uuid:{self.encounter_id}", "resource": encounter_resource}
+            return [entry], {'Encounter': 1}
+
+        if value is _MISSING:
+            return [], {}
+        return self.transformer._create_entity_entries(
+            self.patient_id, self.encounter_id, value, self.timestamp
+        )
+
+
 def create_fhir_transformer(audit_logger: Optional[AuditLogger] = None) -> FHIRTransformer:
     """Factory function to create a FHIRTransformer instance"""
     return FHIRTransformer(audit_logger=audit_logger)
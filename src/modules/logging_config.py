@@ -0,0 +1,69 @@
+"""
+Logging Configuration
+Routes all log records through an in-memory queue so that emitting a log
+line never blocks the pipeline on stream I/O; a background listener thread
+formats records as JSON lines for log aggregators
+"""
+
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from pythonjsonlogger import jsonlogger
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(level: Optional[str] = None) -> QueueListener:
+    """
+    Install a QueueHandler on the root logger and start its listener
+
+    Safe to call more than once; later calls only update the level.
+
+    Args:
+        level: Log level name (defaults to the LOG_LEVEL env var, or INFO)
+
+    Returns:
+        The running QueueListener (stop it to flush on shutdown)
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(level or os.getenv('LOG_LEVEL', 'INFO'))
+
+    if _listener is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(
+            jsonlogger.JsonFormatter('%(asctime)s %(levelname)s %(name)s %(message)s')
+        )
+
+        root.handlers[:] = [QueueHandler(log_queue)]
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+    return _listener
+
+
+def restart_logging_after_fork() -> QueueListener:
+    """
+    Start a fresh queue and listener in a forked child
+
+    The parent's listener thread does not survive fork(), so records queued
+    by the child would otherwise never be written.
+    """
+    global _listener
+    _listener = None
+    return configure_logging()
+
+
+def shutdown_logging():
+    """Stop the listener, flushing any queued records"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
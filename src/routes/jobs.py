@@ -0,0 +1,90 @@
+"""
+Job Routes - Enqueue and poll background pipeline runs
+Conversations are processed by Celery workers (see tasks.py) so the
+web worker returns immediately instead of waiting on the Claude API
+
+HIPAA Note: Every endpoint is protected with @login_required.
+Internal exception details are never surfaced to the caller.
+"""
+
+import logging
+import re
+import uuid
+
+from flask import Blueprint, request, jsonify
+from flask_login import login_required
+from tasks import celery, process_conversation_task
+
+logger = logging.getLogger(__name__)
+
+jobs_bp = Blueprint('jobs', __name__, url_prefix='/api/jobs')
+
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE,
+)
+
+# Hard cap on submitted conversation size (characters)
+_MAX_CONVERSATION_LENGTH = 200_000
+
+
+@jobs_bp.route('', methods=['POST'])
+@login_required
+def submit_job():
+    """
+    Enqueue a conversation for background processing.
+
+    JSON body:
+    {
+        "conversation": "Doctor: ... Patient: ..."
+    }
+
+    The returned job_id doubles as the pipeline transaction ID.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({'error': 'Request body must be valid JSON'}), 400
+
+    conversation = data.get('conversation')
+    if not isinstance(conversation, str) or not conversation.strip():
+        return jsonify({'error': 'Missing required field: conversation'}), 400
+    if len(conversation) > _MAX_CONVERSATION_LENGTH:
+        return jsonify({'error': 'Conversation is too long'}), 400
+
+    try:
+        job_id = str(uuid.uuid4())
+        process_conversation_task.apply_async(
+            args=[conversation],
+            kwargs={'transaction_id': job_id},
+            task_id=job_id,
+        )
+        return jsonify({'job_id': job_id, 'state': 'PENDING'}), 202
+    except Exception as exc:
+        logger.error('Failed to enqueue job: %s', exc, exc_info=True)
+        return jsonify({'error': 'Failed to enqueue job'}), 500
+
+
+@jobs_bp.route('/<job_id>', methods=['GET'])
+@login_required
+def get_job(job_id):
+    """
+    Poll the state of a background job.
+
+    States: PENDING, STARTED, RUNNING, SUCCESS, FAILURE
+    """
+    if not _UUID_RE.match(job_id):
+        return jsonify({'error': 'Invalid job ID format'}), 400
+
+    try:
+        async_result = celery.AsyncResult(job_id)
+        response = {'job_id': job_id, 'state': async_result.state}
+
+        if async_result.state == 'SUCCESS':
+            response['result'] = async_result.result
+        elif async_result.state == 'FAILURE':
+            response['error'] = 'Job failed'
+
+        return jsonify(response), 200
+    except Exception as exc:
+        logger.error('Failed to fetch job %s: %s', job_id, exc, exc_info=True)
+        return jsonify({'error': 'Failed to retrieve job status'}), 500
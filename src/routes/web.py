@@ -7,6 +7,7 @@ to templates, preventing accidental information disclosure.
 """
 
 import logging
+import re
 
 from flask import Blueprint, render_template, request, redirect, url_for
 from flask_login import login_required, current_user
@@ -22,6 +23,12 @@ review_service = get_review_service()
 
 _GENERIC_ERROR = 'An unexpected error occurred. Please try again.'
 
+_UUID_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
+    re.IGNORECASE,
+)
+_CLINICIAN_ID_RE = re.compile(r'^[\w\-]{1,64}$')
+
 
 @web_bp.route('/')
 def index():
@@ -48,7 +55,7 @@ def review_queue():
     try:
         page = max(request.args.get('page', 1, type=int), 1)
         limit = 25
-        flagged = note_service.get_flagged_notes(min_confidence=0.85, limit=100)
+        flagged = note_service.get_flagged_notes(min_confidence=0.85, limit=100, include_bundle=False)
 
         total = len(flagged)
         pages = max((total + limit - 1) // limit, 1)
@@ -72,12 +79,7 @@ def review_queue():
 def note_detail(transaction_id):
     """Detailed view of a specific note."""
     # Basic UUID format check before hitting the database
-    import re
-    if not re.match(
-        r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$',
-        transaction_id,
-        re.IGNORECASE,
-    ):
+    if not _UUID_RE.match(transaction_id):
         return render_template('error.html', error='Invalid note ID'), 400
 
     try:
@@ -196,8 +198,7 @@ def search():
 @login_required
 def clinician_profile(clinician_id):
     """View clinician profile and statistics."""
-    import re as _re
-    if not _re.match(r'^[\w\-]{1,64}$', clinician_id):
+    if not _CLINICIAN_ID_RE.match(clinician_id):
         return render_template('error.html', error='Invalid clinician ID'), 400
 
     try:
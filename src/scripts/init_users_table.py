@@ -34,16 +34,14 @@ def init_users_table():
     """
 
     try:
-        db = PostgreSQLConnection()
+        db = PostgreSQLConnection(minconn=1, maxconn=1)
         if not db.connect():
             print("❌ Failed to connect to PostgreSQL")
             return False
 
         # Execute the SQL
-        cursor = db.connection.cursor()
-        cursor.execute(sql)
-        db.connection.commit()
-        cursor.close()
+        with db.cursor() as cursor:
+            cursor.execute(sql)
 
         print("✅ Users table created successfully!")
         db.disconnect()
@@ -3,7 +3,12 @@ Note Service - Database queries for clinical notes
 Handles retrieval and filtering of notes from MongoDB and PostgreSQL
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
 
@@ -13,6 +18,8 @@ try:
 except ImportError:
     DB_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class NoteService:
     """Service for querying and managing clinical notes"""
@@ -20,6 +27,13 @@ class NoteService:
     def __init__(self):
         self.mongodb = get_mongodb_connection() if DB_AVAILABLE else None
         self.postgres = get_postgres_connection() if DB_AVAILABLE else None
+        # fhir_bundles / clinical_notes documents are never modified once
+        # written, so note detail reads keep them in a per-process TTL LRU;
+        # review history is always read fresh, as any worker can add one
+        self._note_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._note_cache_size = int(os.getenv('NOTE_CACHE_SIZE', 2048))
+        self._note_cache_ttl = float(os.getenv('NOTE_CACHE_TTL', 300))
+        self._note_cache_lock = threading.Lock()
 
     def get_all_notes(self, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """
@@ -64,16 +78,22 @@ class NoteService:
                 'pages': (total + limit - 1) // limit
             }
         except Exception as e:
-            print(f"❌ Error fetching notes: {e}")
+            logger.error('Error fetching notes: %s', e)
             return {'notes': [], 'total': 0, 'limit': limit, 'offset': offset, 'error': str(e)}
 
-    def get_flagged_notes(self, min_confidence: float = 0.85, limit: int = 50) -> List[Dict[str, Any]]:
+    def get_flagged_notes(
+        self,
+        min_confidence: float = 0.85,
+        limit: int = 50,
+        include_bundle: bool = True
+    ) -> List[Dict[str, Any]]:
         """
         Get notes flagged for review (low confidence)
 
         Args:
             min_confidence: Minimum confidence threshold (0-1)
             limit: Maximum number of notes to return
+            include_bundle: Whether to fetch each note's full FHIR bundle
 
         Returns:
             List of flagged notes
@@ -90,6 +110,7 @@ class NoteService:
             flagged = list(
                 collection.find(
                     {'confidence_score': {'$lt': threshold}},
+                    projection=None if include_bundle else {'bundle': 0},
                     sort=[('confidence_score', 1), ('created_at', -1)]
                 ).limit(limit)
             )
@@ -102,7 +123,7 @@ class NoteService:
 
             return flagged
         except Exception as e:
-            print(f"❌ Error fetching flagged notes: {e}")
+            logger.error('Error fetching flagged notes: %s', e)
             return []
 
     def get_note_by_id(self, transaction_id: str) -> Optional[Dict[str, Any]]:
@@ -119,40 +140,95 @@ class NoteService:
             return None
 
         try:
+            bundle = self._cached_note(transaction_id)
+            if bundle is not None:
+                reviews = list(
+                    self.mongodb.db['clinician_reviews'].find({'transaction_id': transaction_id})
+                )
+                return self._format_note(transaction_id, bundle, reviews)
+
             bundles_collection = self.mongodb.db['fhir_bundles']
-            notes_collection = self.mongodb.db['clinical_notes']
-            reviews_collection = self.mongodb.db['clinician_reviews']
 
-            # Get FHIR bundle
-            bundle = bundles_collection.find_one({'transaction_id': transaction_id})
+            # Get FHIR bundle, joined server-side with its clinical note
+            # metadata and review history in a single round trip
+            pipeline = [
+                {'$match': {'transaction_id': transaction_id}},
+                {'$limit': 1},
+                {
+                    '$lookup': {
+                        'from': 'clinical_notes',
+                        'localField': 'transaction_id',
+                        'foreignField': 'transaction_id',
+                        'as': 'clinical_notes'
+                    }
+                },
+                {
+                    '$lookup': {
+                        'from': 'clinician_reviews',
+                        'localField': 'transaction_id',
+                        'foreignField': 'transaction_id',
+                        'as': 'reviews'
+                    }
+                }
+            ]
+            bundle = next(bundles_collection.aggregate(pipeline), None)
 
             if not bundle:
                 return None
 
-            # Get clinical note metadata
-            note_meta = notes_collection.find_one({'transaction_id': transaction_id})
-
-            # Get review history
-            reviews = list(reviews_collection.find({'transaction_id': transaction_id}))
-
-            # Format response
-            result = {
-                'transaction_id': transaction_id,
-                'confidence_score': bundle.get('confidence_score', 0),
-                'validation_status': bundle.get('validation_status', 'unknown'),
-                'created_at': bundle.get('created_at').isoformat() if bundle.get('created_at') else None,
-                'updated_at': bundle.get('updated_at').isoformat() if bundle.get('updated_at') else None,
-                'fhir_bundle': bundle.get('bundle', {}),
-                'masked_text': note_meta.get('masked_text', '') if note_meta else '',
-                'structured_output': note_meta.get('structured_output', {}) if note_meta else {},
-                'review_history': reviews
-            }
-
-            return result
+            reviews = bundle.pop('reviews')
+            # The clinical note is written just after its bundle; only cache
+            # a complete join
+            if bundle['clinical_notes']:
+                self._remember_note(transaction_id, bundle)
+            return self._format_note(transaction_id, bundle, reviews)
         except Exception as e:
-            print(f"❌ Error fetching note {transaction_id}: {e}")
+            logger.error('Error fetching note %s: %s', transaction_id, e)
             return None
 
+    @staticmethod
+    def _format_note(
+        transaction_id: str,
+        bundle: Dict[str, Any],
+        reviews: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build the note detail response from a joined fhir_bundles document"""
+        note_meta = bundle['clinical_notes'][0] if bundle['clinical_notes'] else None
+        return {
+            'transaction_id': transaction_id,
+            'confidence_score': bundle.get('confidence_score', 0),
+            'validation_status': bundle.get('validation_status', 'unknown'),
+            'created_at': bundle.get('created_at').isoformat() if bundle.get('created_at') else None,
+            'updated_at': bundle.get('updated_at').isoformat() if bundle.get('updated_at') else None,
+            'fhir_bundle': bundle.get('bundle', {}),
+            'masked_text': note_meta.get('masked_text', '') if note_meta else '',
+            'structured_output': note_meta.get('structured_output', {}) if note_meta else {},
+            'review_history': reviews
+        }
+
+    def _cached_note(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached joined bundle document, marking it recently used"""
+        with self._note_cache_lock:
+            entry = self._note_cache.get(transaction_id)
+            if entry is None:
+                return None
+            expires_at, bundle = entry
+            if expires_at <= time.monotonic():
+                del self._note_cache[transaction_id]
+                return None
+            self._note_cache.move_to_end(transaction_id)
+            return bundle
+
+    def _remember_note(self, transaction_id: str, bundle: Dict[str, Any]) -> None:
+        """Add to the note LRU, evicting the least recently used"""
+        if self._note_cache_size <= 0:
+            return
+        with self._note_cache_lock:
+            self._note_cache[transaction_id] = (time.monotonic() + self._note_cache_ttl, bundle)
+            self._note_cache.move_to_end(transaction_id)
+            while len(self._note_cache) > self._note_cache_size:
+                self._note_cache.popitem(last=False)
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get dashboard statistics
@@ -173,11 +249,12 @@ class NoteService:
             # Count flagged notes (confidence < 0.85)
             flagged_count = bundles.count_documents({'confidence_score': {'$lt': 0.85}})
 
-            # Count reviewed notes
-            reviewed_transaction_ids = set(
-                doc['transaction_id'] for doc in reviews.find({}, {'transaction_id': 1})
-            )
-            reviewed_count = len(reviewed_transaction_ids)
+            # Count reviewed notes (distinct transactions, counted server-side)
+            reviewed = list(reviews.aggregate([
+                {'$group': {'_id': '$transaction_id'}},
+                {'$count': 'reviewed_count'}
+            ]))
+            reviewed_count = reviewed[0]['reviewed_count'] if reviewed else 0
 
             # Get approval rate
             approvals = reviews.count_documents({'action': 'approve'})
@@ -212,7 +289,7 @@ class NoteService:
                 'max_confidence': confidence_stats.get('max_confidence', 0)
             }
         except Exception as e:
-            print(f"❌ Error fetching statistics: {e}")
+            logger.error('Error fetching statistics: %s', e)
             return self._empty_stats()
 
     def extract_field_confidences(self, note_data: Dict[str, Any]) -> Dict[str, float]:
@@ -247,7 +324,7 @@ class NoteService:
 
             return confidences
         except Exception as e:
-            print(f"⚠️  Warning: Could not extract field confidences: {e}")
+            logger.warning('Could not extract field confidences: %s', e)
             return {}
 
     @staticmethod
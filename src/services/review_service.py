@@ -3,6 +3,7 @@ Review Service - Manages clinician reviews and decisions
 Handles approval, rejection, and escalation of clinical notes
 """
 
+import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -12,6 +13,8 @@ try:
 except ImportError:
     DB_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class ReviewService:
     """Service for managing clinician reviews"""
@@ -40,7 +43,7 @@ class ReviewService:
             True if successful, False otherwise
         """
         if action not in ['approve', 'reject', 'flag_for_escalation']:
-            print(f"❌ Invalid action: {action}")
+            logger.warning('Invalid action: %s', action)
             return False
 
         try:
@@ -67,11 +70,11 @@ class ReviewService:
                     }
                 )
 
-            print(f"✓ Review submitted: {transaction_id} → {action}")
+            logger.debug('Review submitted: %s → %s', transaction_id, action)
             return True
 
         except Exception as e:
-            print(f"❌ Error submitting review: {e}")
+            logger.error('Error submitting review: %s', e)
             return False
 
     def get_review_history(self, transaction_id: str) -> list:
@@ -99,7 +102,7 @@ class ReviewService:
 
             return reviews
         except Exception as e:
-            print(f"❌ Error fetching review history: {e}")
+            logger.error('Error fetching review history: %s', e)
             return []
 
     def get_clinician_stats(self, clinician_id: str) -> Dict[str, Any]:
@@ -140,7 +143,7 @@ class ReviewService:
                 'approval_rate': approvals / total if total > 0 else 0
             }
         except Exception as e:
-            print(f"❌ Error fetching clinician stats: {e}")
+            logger.error('Error fetching clinician stats: %s', e)
             return self._empty_clinician_stats()
 
     def get_reviews_by_action(self, action: str, limit: int = 50) -> list:
@@ -170,7 +173,7 @@ class ReviewService:
 
             return reviews
         except Exception as e:
-            print(f"❌ Error fetching reviews: {e}")
+            logger.error('Error fetching reviews: %s', e)
             return []
 
     @staticmethod
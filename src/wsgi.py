@@ -0,0 +1,11 @@
+"""
+WSGI Entry Point
+Production entry point for gunicorn/uWSGI:
+    cd src && gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+from modules.logging_config import configure_logging
+from app import create_app
+
+configure_logging()
+application = create_app()
@@ -0,0 +1,47 @@
+"""
+Regression tests for the async Claude rate limiter
+Run from the repository root: python -m unittest discover -s tests
+"""
+
+import asyncio
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from modules.claude_api import _AsyncRateLimiter
+
+
+class AsyncRateLimiterTest(unittest.IsolatedAsyncioTestCase):
+
+    async def _timed_acquire(self, limiter, tokens):
+        start = time.monotonic()
+        await asyncio.wait_for(limiter.acquire(tokens), timeout=2)
+        return time.monotonic() - start
+
+    async def test_tpm_only_limit_waits_for_tokens(self):
+        limiter = _AsyncRateLimiter(None, 600000)
+        await limiter.acquire(599000)
+        waited = await self._timed_acquire(limiter, 2000)
+        # 1000 missing tokens at 10000 tokens/s
+        self.assertGreaterEqual(waited, 0.05)
+        self.assertLess(waited, 1)
+
+    async def test_rpm_only_limit_waits_for_request(self):
+        limiter = _AsyncRateLimiter(600, None)
+        limiter.available_request_capacity = 0
+        waited = await self._timed_acquire(limiter, 10 ** 9)
+        # One request refills in 0.1s at 600 rpm
+        self.assertGreaterEqual(waited, 0.05)
+        self.assertLess(waited, 1)
+
+    async def test_unbounded_limiter_never_waits(self):
+        limiter = _AsyncRateLimiter(None, None)
+        waited = await self._timed_acquire(limiter, 10 ** 9)
+        self.assertLess(waited, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()